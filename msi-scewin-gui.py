@@ -11,15 +11,161 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import re
 import os
+import bisect
 import subprocess
 import ctypes
 import sys
 import shutil
 import threading
+import time
 import queue
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+from functools import partial
+from contextlib import contextmanager
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 import tempfile
+import mmap
+import gc
+import multiprocessing
+
+
+# Files at least this large are parsed in worker processes, in chunks of blocks;
+# smaller exports parse faster than a process pool can start
+_PARALLEL_PARSE_MIN_BYTES = 16 * 1024 * 1024
+_PARSE_CHUNK_SIZE = 2000
+# Generation-0 GC threshold while a parse is running (the default is 700)
+_PARSE_GC_THRESHOLD0 = 50000
+
+# MSI Center's bundled SCEWIN, and the files SCEWIN_64.exe needs beside it to run from the temp dir
+_SCEWIN_DIRS = (
+    r"C:\Program Files (x86)\MSI\MSI Center\Lib\SCEWIN\5.05.01.0002",
+    r"C:\Program Files\MSI\MSI Center\Lib\SCEWIN\5.05.01.0002",
+)
+_SCEWIN_FILES = ("SCEWIN_64.exe", "amifldrv64.sys", "amigendrv64.sys")
+# SCEWIN.exe in any installed SCEWIN version, under either Program Files directory
+_SCETOOL_GLOB = r"C:\Program Files*\MSI\MSI Center\Lib\SCEWIN\*\SCEWIN.exe"
+
+# Precompiled patterns used by the NVRAM parser, validator and category menu
+_RE_SETUP_EQ = re.compile(rb'\s*=')
+_RE_SETUP_Q = re.compile(r'Setup Question\s*=\s*(.+)')
+_RE_VALUE_ANGLE = re.compile(r'<([^>]+)>')
+_RE_OPTION = re.compile(r'\[([^\]]+)\]([^/\n]*)')
+_RE_RANGE = re.compile(r'range[:=]?\s*(\d+)\s*[~\-]\s*(\d+)')
+_RE_WORD = re.compile(r'\b\w+\b')
+# Used by generate_nvram_file to move the * marker and rewrite <values>
+_RE_OPTION_MARK = re.compile(r'(Options\s*=\s*)?(\s*)')
+_RE_ANGLE_VALUE = re.compile(r'<[^>]*>')
+# Header fields: the named group of the matching alternative holds the value
+_RE_HEADER = re.compile(
+    r'(?=.*Script File Name)[^:]*:(?P<filename>.*)'
+    r'|(?=.*Created on)[^:]*:(?:[^:]*:(?P<created>.*))?'
+    r'|(?=.*AMISCE Utility)(?P<utility>.*)'
+    r'|(?=.*HIICrc32)[^=]*=(?P<crc32>.*)'
+)
+
+
+# Words too generic to be offered as categories in the category dropdown
+_CATEGORY_STOPWORDS = frozenset([
+    'the', 'and', 'or', 'to', 'of', 'in', 'for', 'on', 'with', 'by', 'is', 'at', 'as', 'an', 'be', 'are',
+    'from', 'this', 'that', 'it', 'if', 'not', 'can', 'will', 'a', 'but', 'was', 'has', 'have', 'may', 'all',
+    'help', 'string', 'text', 'value', 'option', 'set', 'setting', 'settings', 'default', 'enable', 'disable',
+    'yes', 'no', 'auto', 'user', 'system', 'mode', 'type', 'select', 'use', 'change', 'current', 'bios', 'token',
+    'offset', 'width', 'page', 'number', 'data', 'field', 'bit', 'bits', 'description', 'desc', 'info', 'information',
+    'boot', 'save', 'import', 'export', 'file', 'load', 'backup', 'restore', 'undo', 'redo', 'options',
+    'nvram', 'msi', 'ami', 'center', 'utility', 'ver', 'copyright', 'reserved', 'crc32', 'script', 'name', 'created',
+    'do', 'line', 'move', 'desired',
+])
+
+# Options given to 0/1 settings described as Enabled/Disabled, by current value;
+# the tuples are shared, each setting gets its own list
+_ENABLE_DISABLE_OPTIONS = {
+    0: (('1', 'Enabled', False), ('0', 'Disabled', True)),
+    1: (('1', 'Enabled', True), ('0', 'Disabled', False)),
+}
+
+
+def _has_enable_disable(text):
+    """True if lowercased text mentions both 'enabled' and 'disabled'"""
+    return 'enabled' in text and 'disabled' in text
+
+
+def _is_option_line(stripped):
+    """True if a stripped block line lists an option: "[..." or "Options = [...", either possibly starred"""
+    if stripped.startswith('Options'):
+        rest = stripped[7:].lstrip()
+        if not rest.startswith('='):
+            return False
+        stripped = rest[1:].lstrip()
+    return stripped.startswith('[') or stripped.startswith('*[')
+
+
+# (fuzz, process) once rapidfuzz is imported, False if it is not installed
+_rapidfuzz = None
+
+
+def _load_rapidfuzz():
+    """Import rapidfuzz's (fuzz, process) on first use; None if it is not installed.
+    
+    The outcome is remembered, so a missing package is looked up once rather than
+    on every search.
+    """
+    global _rapidfuzz
+    if _rapidfuzz is None:
+        try:
+            from rapidfuzz import fuzz, process
+            _rapidfuzz = (fuzz, process)
+        except ImportError:
+            _rapidfuzz = False
+    return _rapidfuzz or None
+
+
+def _iter_highlight_spans(pattern, text):
+    """Yield (literal, match) pairs covering text in one finditer pass; either may be empty"""
+    pos = 0
+    if pattern is not None:
+        for m in pattern.finditer(text):
+            yield text[pos:m.start()], m.group()
+            pos = m.end()
+    if pos < len(text):
+        yield text[pos:], ""
+
+
+def _safe_read(path):
+    """Text of a (SCEWIN log) file, or "" if it is missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+_gc_lock = threading.Lock()
+_gc_parses = 0
+_gc_saved_threshold = None
+
+
+@contextmanager
+def _relaxed_gc():
+    """Collect generation 0 far less often while parsing.
+
+    The threshold is process-wide, so the GUI thread keeps cyclic GC, just less frequently,
+    until the last overlapping parse finishes and a young collection catches up."""
+    global _gc_parses, _gc_saved_threshold
+    with _gc_lock:
+        if _gc_parses == 0:
+            _gc_saved_threshold = gc.get_threshold()
+            gc.set_threshold(_PARSE_GC_THRESHOLD0, *_gc_saved_threshold[1:])
+        _gc_parses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_parses -= 1
+            if _gc_parses == 0:
+                gc.set_threshold(*_gc_saved_threshold)
+        gc.collect(0)
 
 
 def run_as_admin():
@@ -32,13 +178,9 @@ def run_as_admin():
     sys.exit()
 
 
-# Call this at the start of your script
-run_as_admin()
-
-
 class BIOSSetting:
     """Represents a single BIOS setting with optimized structure"""
-    __slots__ = ("setup_question", "help_string", "token", "offset", "width", "bios_default", "options", "current_value", "is_numeric", "original_value", "original_has_options", "original_block_lines")
+    __slots__ = ("setup_question", "help_string", "token", "offset", "width", "bios_default", "options", "current_value", "is_numeric", "original_value", "original_has_options", "original_block", "_search_blob", "_display_label", "_option_desc", "_combo_choices", "_value_range", "dirty")
     def __init__(self, setup_question="", help_string="", token="", offset="", 
                  width="", bios_default="", options=None, current_value=None, is_numeric=False):
         self.setup_question = setup_question
@@ -51,7 +193,72 @@ class BIOSSetting:
         self.current_value = current_value or ""
         self.is_numeric = is_numeric
         self.original_has_options = False
-        self.original_block_lines = []
+        self.original_block = ""
+        self._search_blob = ""
+        self._display_label = ""
+        self._option_desc = None
+        self._combo_choices = None
+        self._value_range = None
+        # Set on the first edit (original_value then holds the value before it); cleared after import
+        self.dirty = False
+    
+    # Parsed fields copied between processes when blocks are parsed in parallel
+    _TRANSFER_FIELDS = ("setup_question", "help_string", "token", "offset", "width", "bios_default",
+                        "options", "current_value", "is_numeric", "original_has_options",
+                        "original_block", "_search_blob", "_display_label")
+    
+    def to_fields(self):
+        """Return parsed fields as a plain tuple (see _TRANSFER_FIELDS)"""
+        return tuple(getattr(self, name) for name in self._TRANSFER_FIELDS)
+    
+    @classmethod
+    def from_fields(cls, fields):
+        """Rebuild a setting from a to_fields() tuple"""
+        setting = cls()
+        for name, value in zip(cls._TRANSFER_FIELDS, fields):
+            setattr(setting, name, value)
+        # Re-intern short shared fields, as the parser does
+        setting.offset = sys.intern(setting.offset)
+        setting.width = sys.intern(setting.width)
+        setting.bios_default = sys.intern(setting.bios_default)
+        return setting
+    
+    def _option_descriptions(self):
+        if self._option_desc is None:
+            # Built on first use; option descriptions never change after parsing.
+            # Reversed so the first option wins when values repeat
+            self._option_desc = {str(v): f"{desc} ({v})" for v, desc, *_ in reversed(self.options)}
+        return self._option_desc
+    
+    def describe_value(self, value):
+        """Return "description (value)" for a value that matches an option, else the value as a string"""
+        value = str(value)
+        return self._option_descriptions().get(value, value)
+    
+    def is_option_value(self, value):
+        """Return True if value, compared as a string, is one of the option values"""
+        return str(value) in self._option_descriptions()
+    
+    def combo_choices(self):
+        """Return (option value strings, "value : description" combobox entries), built on first use"""
+        if self._combo_choices is None:
+            values = [str(value) for value, _, _ in self.options]
+            labels = [f"{value} : {desc[:50]}" + ("..." if len(desc) > 50 else "") if desc else value
+                      for value, (_, desc, _) in zip(values, self.options)]
+            self._combo_choices = (values, labels)
+        return self._combo_choices
+    
+    def value_range(self):
+        """(min, max) from a "range: min ~ max" note in the help string, or None; parsed on first use"""
+        if self._value_range is None:
+            m = _RE_RANGE.search(self.help_string) if self.help_string else None
+            self._value_range = (int(m.group(1)), int(m.group(2))) if m else ()
+        return self._value_range or None
+    
+    @property
+    def original_block_lines(self):
+        """Non-empty lines of the original block (including comments and formatting), split on demand"""
+        return [line for line in self.original_block.split('\n') if line.strip()]
 
 
 class ProgressDialog:
@@ -89,15 +296,21 @@ class ProgressDialog:
         self.cancel_button.pack(pady=(10, 0))
         
         self.cancelled = False
+        self._last_redraw = 0.0
         self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
     
     def update_progress(self, value, status=""):
-        """Update progress bar and status"""
-        if not self.cancelled:
+        """Update progress bar and status, redrawing the dialog at most ~30 times a second"""
+        # Updates posted from a worker can arrive after the dialog has been closed
+        if not self.cancelled and self.dialog.winfo_exists():
             self.progress['value'] = value
             if status:
                 self.status_label.config(text=status)
-            self.dialog.update()
+            # The widgets always hold the latest state; only the redraw is throttled
+            now = time.monotonic()
+            if now - self._last_redraw >= 0.033 or value >= 100:
+                self._last_redraw = now
+                self.dialog.update_idletasks()
     
     def cancel(self):
         """Handle cancellation"""
@@ -119,177 +332,279 @@ class OptimizedNVRAMParser:
         self.settings = []
         self.header_info = {}
         self.raw_header = ""
-        self.categories = defaultdict(list)
+        # Category -> setting indices, as compact int arrays rather than lists of int objects
+        self.categories = defaultdict(partial(array, 'i'))
         self._cancelled = False
         
     def parse_file(self, file_path, progress_callback=None, cancel_flag=None):
         """Parse NVRAM file with optimized processing and progress updates"""
+        try:
+            return self._parse_file(file_path, progress_callback, cancel_flag)
+        except Exception as e:
+            messagebox.showerror("Parsing Error", f"Failed to parse BIOS file:\n{e}")
+            return False
+    
+    def parse_file_async(self, file_path, result_queue, cancel_flag=None):
+        """Parse NVRAM file on a worker thread, posting (kind, value, status) tuples to result_queue.
+        
+        kind is 'progress' while parsing, then 'done' with the settings list or 'error' with the exception.
+        """
+        def progress_callback(value, status=""):
+            result_queue.put(('progress', value, status))
+        try:
+            settings = self._parse_file(file_path, progress_callback, cancel_flag)
+        except Exception as e:
+            result_queue.put(('error', e, ""))
+        else:
+            result_queue.put(('done', settings, ""))
+    
+    def _parse_file(self, file_path, progress_callback=None, cancel_flag=None):
+        """Reset parser state and parse the file, letting errors propagate"""
         self.settings = []
         self.raw_header = ""
         self.categories.clear()
         self._cancelled = False
         
-        try:
-            # Read file with proper encoding handling
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-                content = file.read()
-            
-            if progress_callback:
-                progress_callback(10, "File loaded, parsing header...")
-            
-            # Extract and parse header
-            header_end_pos = content.find("Setup Question")
-            if header_end_pos > 0:
-                self.raw_header = content[:header_end_pos]
-                self._parse_header(self.raw_header)
-            
+        # Map the file instead of reading it into one large string;
+        # blocks are decoded individually as they are parsed
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return self.settings
+            # Parsing allocates thousands of long-lived, cycle-free objects; frequent cyclic GC
+            # passes over them during the parse only cost time
+            with _relaxed_gc(), mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self._parse_buffer(content, progress_callback, cancel_flag)
+    
+    def _parse_buffer(self, content, progress_callback=None, cancel_flag=None):
+        """Parse settings from a mapped NVRAM byte buffer"""
+        if progress_callback:
+            progress_callback(10, "File loaded, parsing header...")
+        
+        # Extract and parse header
+        header_end_pos = content.find(b"Setup Question")
+        if header_end_pos > 0:
+            self.raw_header = self._decode(content[:header_end_pos])
+            self._parse_header(self.raw_header)
+        
+        if cancel_flag and cancel_flag():
+            return []
+        
+        if progress_callback:
+            progress_callback(20, "Splitting into setting blocks...")
+        
+        if progress_callback:
+            progress_callback(30, "Processing settings...")
+        
+        start = header_end_pos if header_end_pos > 0 else 0
+        if len(content) >= _PARALLEL_PARSE_MIN_BYTES and (os.cpu_count() or 1) > 1:
+            self._parse_blocks_parallel(content, start, progress_callback, cancel_flag)
+        else:
+            self._parse_blocks_serial(content, start, progress_callback, cancel_flag)
+        
+        self._infer_enable_disable_options()
+        
+        # Categorize settings for faster filtering in one grouping pass
+        self._group_categories()
+        
+        if progress_callback:
+            progress_callback(95, "Finalizing...")
+        
+        return self.settings
+    
+    def _parse_blocks_serial(self, content, start, progress_callback=None, cancel_flag=None):
+        """Parse setting blocks in this thread"""
+        # Scan blocks lazily; progress is derived from the scan offset
+        content_len = max(1, len(content))
+        progress_step = max(1, content_len // 50)  # Update progress every 2%
+        next_progress = 0
+        processed = 0
+        
+        for end_pos, block in self._iter_blocks(content, start):
             if cancel_flag and cancel_flag():
-                return []
-            
-            if progress_callback:
-                progress_callback(20, "Splitting into setting blocks...")
-            
-            # Optimized block splitting using regex
-            setting_content = content[header_end_pos:] if header_end_pos > 0 else content
-            setting_blocks = re.split(r'\n(?=Setup Question\s*=)', setting_content)
+                break
             
-            # Filter out empty blocks
-            setting_blocks = [block.strip() for block in setting_blocks if block.strip()]
-            total_blocks = len(setting_blocks)
+            block = block.strip()
+            if not block:
+                continue
+            processed += 1
             
-            if progress_callback:
-                progress_callback(30, f"Processing {total_blocks} settings...")
+            setting = self._parse_setting_block(self._decode(block))
+            if setting:
+                self.settings.append(setting)
             
-            # Process blocks with batch progress updates
-            batch_size = max(1, total_blocks // 50)  # Update progress every 2%
+            # Update progress in batches
+            if progress_callback and end_pos >= next_progress:
+                progress_value = 30 + int(end_pos / content_len * 60)
+                progress_callback(progress_value, f"Processed {processed} settings...")
+                next_progress = end_pos + progress_step
+    
+    def _parse_blocks_parallel(self, content, start, progress_callback=None, cancel_flag=None):
+        """Parse setting blocks in worker processes, in chunks, keeping file order"""
+        content_len = max(1, len(content))
+        with ProcessPoolExecutor() as executor:
+            # Submit chunks while scanning so workers start before the scan finishes
+            futures = []
+            chunk = []
+            for end_pos, block in self._iter_blocks(content, start):
+                block = block.strip()
+                if block:
+                    chunk.append(self._decode(block))
+                if len(chunk) >= _PARSE_CHUNK_SIZE:
+                    futures.append((end_pos, executor.submit(_parse_blocks_batch, chunk)))
+                    chunk = []
+            if chunk:
+                futures.append((len(content), executor.submit(_parse_blocks_batch, chunk)))
             
-            for i, block in enumerate(setting_blocks):
+            for end_pos, future in futures:
                 if cancel_flag and cancel_flag():
+                    for _, pending in futures:
+                        pending.cancel()
                     break
-                
-                setting = self._parse_setting_block(block)
-                if setting:
-                    self.settings.append(setting)
-                    
-                    # Categorize settings for faster filtering
-                    category = self._extract_category(setting.setup_question)
-                    self.categories[category].append(len(self.settings) - 1)
-                
-                # Update progress in batches
-                if progress_callback and (i % batch_size == 0 or i == total_blocks - 1):
-                    progress_value = 30 + int((i + 1) / total_blocks * 60)
-                    status = f"Processed {i + 1} of {total_blocks} settings..."
-                    progress_callback(progress_value, status)
-            
-            if progress_callback:
-                progress_callback(95, "Finalizing...")
-            
-            return self.settings
-            
-        except Exception as e:
-            messagebox.showerror("Parsing Error", f"Failed to parse BIOS file:\n{e}")
-            return False
+                for fields in future.result():
+                    if fields:
+                        self.settings.append(BIOSSetting.from_fields(fields))
+                if progress_callback:
+                    progress_value = 30 + int(end_pos / content_len * 60)
+                    progress_callback(progress_value, f"Processed {len(self.settings)} settings...")
+    
+    def _infer_enable_disable_options(self):
+        """Turn numeric 0/1 settings described as Enabled/Disabled into two-option settings"""
+        for setting in self.settings:
+            if not setting.is_numeric:
+                continue
+            try:
+                v = int(setting.current_value)
+            except ValueError:
+                continue
+            if v not in (0, 1):
+                continue
+            # Look for 'Enabled' and 'Disabled' in the question or help string,
+            # using the lowercased text already built for search
+            question, help_string, _ = setting._search_blob.split('\0', 2)
+            if _has_enable_disable(help_string) or _has_enable_disable(question):
+                setting.options = list(_ENABLE_DISABLE_OPTIONS[v])
+                setting.is_numeric = False
+    
+    def _group_categories(self):
+        """Rebuild the category -> setting indices map from the parsed settings"""
+        categories = self.categories
+        categories.clear()
+        extract = self._extract_category
+        for index, setting in enumerate(self.settings):
+            categories[extract(setting.setup_question)].append(index)
+    
+    @staticmethod
+    def _decode(data):
+        """Decode a byte slice with the same newline handling as text-mode reads"""
+        text = data.decode('utf-8', errors='replace')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    @staticmethod
+    def _iter_blocks(content, start=0):
+        """Yield (end_offset, block) for each Setup Question block using find()"""
+        key = b"\nSetup Question"
+        key_len = len(key)
+        pos = start
+        nxt = content.find(key, pos)
+        while nxt >= 0:
+            if _RE_SETUP_EQ.match(content, nxt + key_len):
+                yield nxt, content[pos:nxt]
+                pos = nxt + 1
+            nxt = content.find(key, nxt + 1)
+        yield len(content), content[pos:]
     
     def _extract_category(self, question):
         """Extract category from setting question for organization"""
         if not question:
             return "Other"
         
-        # Extract first meaningful word as category
-        words = question.split()
-        if words:
-            return words[0]
-        return "Other"
+        # First whitespace-separated word as category; maxsplit=1 avoids building the full word list
+        words = question.split(None, 1)
+        return sys.intern(words[0]) if words else "Other"
     
     def _parse_header(self, header_content):
         """Extract header information with error handling"""
         try:
             for line in header_content.split('\n'):
-                line = line.strip()
-                if 'Script File Name' in line and ':' in line:
-                    self.header_info['filename'] = line.split(':', 1)[1].strip()
-                elif 'Created on' in line and ':' in line:
-                    parts = line.split(':', 2)
-                    if len(parts) > 2:
-                        self.header_info['created'] = parts[2].strip()
-                elif 'AMISCE Utility' in line:
-                    self.header_info['utility'] = line.strip()
-                elif 'HIICrc32' in line and '=' in line:
-                    self.header_info['crc32'] = line.split('=', 1)[1].strip()
+                m = _RE_HEADER.match(line.strip())
+                if m and m.lastgroup:
+                    self.header_info[m.lastgroup] = m.group(m.lastgroup).strip()
         except Exception:
             pass  # Skip header parsing errors
     
+    # Setters for "Key = value" lines, dispatched on the key before '='.
+    # Short fields that repeat across settings are interned; questions and
+    # help strings are mostly unique and are left alone.
+    def _set_help(setting, value):
+        setting.help_string = value
+    
+    def _set_token(setting, value):
+        setting.token = value.split('//')[0].strip() if value else ""
+    
+    def _set_offset(setting, value):
+        setting.offset = sys.intern(value)
+    
+    def _set_width(setting, value):
+        setting.width = sys.intern(value)
+    
+    def _set_default(setting, value):
+        setting.bios_default = sys.intern(value)
+    
+    _FIELD_HANDLERS = {
+        "Help String": _set_help,
+        "Token": _set_token,
+        "Offset": _set_offset,
+        "Width": _set_width,
+        "BIOS Default": _set_default,
+    }
+    
     def _parse_setting_block(self, block):
         """Optimized setting block parser, skips commented-out (//) settings and lines"""
         if not block:
             return None
-        # Save original block lines (including comments and formatting)
-        block_lines = [line for line in block.split('\n') if line.strip()]
-        # Remove lines that start with // (commented out) for parsing, but keep for original_block_lines
-        lines = [line.strip() for line in block_lines if not line.strip().startswith('//')]
-        if not lines:
-            return None
-        # If the first line is not a Setup Question, skip this block
-        if not lines[0].startswith('Setup Question'):
+        # The block starts at a Setup Question line (the splitter guarantees it unless it
+        # is the text before the first one); otherwise skip this block
+        first, _, rest = block.partition('\n')
+        first = first.strip()
+        if not first.startswith('Setup Question'):
             return None
         setting = BIOSSetting()
-        setting.original_block_lines = block_lines
+        # Keep the original block as one string; lines are only split out when writing
+        setting.original_block = block
         try:
             # Use regex patterns for faster parsing
-            setup_match = re.search(r'Setup Question\s*=\s*(.+)', lines[0])
+            setup_match = _RE_SETUP_Q.search(first)
             if setup_match:
                 setting.setup_question = setup_match.group(1).strip()
-            # Track if we see a Value line and its value
-            value_line = None
-            value_val = None
-            help_string = ""
+            # Track if we see a Value line
+            has_value = False
             has_options = False
-            for line in lines[1:]:
-                if line.startswith('Help String'):
-                    help_string = self._extract_value(line)
-                    setting.help_string = help_string
-                elif line.startswith('Token'):
-                    token_value = self._extract_value(line)
-                    setting.token = token_value.split('//')[0].strip() if token_value else ""
-                elif line.startswith('Offset'):
-                    setting.offset = self._extract_value(line)
-                elif line.startswith('Width'):
-                    setting.width = self._extract_value(line)
-                elif line.startswith('BIOS Default'):
-                    setting.bios_default = self._extract_value(line)
-                elif line.startswith('Options') or (setting.options is not None and '[' in line):
-                    if not setting.options:
-                        setting.options = []
+            field_handlers = self._FIELD_HANDLERS
+            # One pass over the remaining lines: strip, skip blank and // lines, dispatch on the key
+            for line in rest.split('\n'):
+                line = line.strip()
+                if not line or line.startswith('//'):
+                    continue
+                eq = line.find('=')
+                handler = field_handlers.get(line[:eq].rstrip()) if eq >= 0 else None
+                if handler:
+                    handler(setting, line[eq + 1:].strip())
+                elif line.startswith('Options') or '[' in line:
                     self._process_option_line(setting, line)
                     has_options = True
                 elif line.startswith('Value'):
-                    value_line = line
-                    value_match = re.search(r'<([^>]+)>', line)
+                    has_value = True
+                    value_match = _RE_VALUE_ANGLE.search(line)
                     if value_match:
-                        value_val = value_match.group(1)
-                        setting.current_value = value_val
+                        setting.current_value = value_match.group(1)
                     else:
-                        value_val = self._extract_value(line)
-                        setting.current_value = value_val
+                        setting.current_value = self._extract_value(line)
             setting.original_has_options = has_options
-            # Special handling: if numeric and value is 0 or 1, and help string indicates Enabled/Disabled, treat as options
-            if value_line is not None and value_val is not None:
-                try:
-                    v = int(value_val)
-                    if v in (0, 1):
-                        # Look for 'Enabled' and 'Disabled' in help string or comment
-                        if (('enabled' in help_string.lower() and 'disabled' in help_string.lower()) or
-                            ('enabled' in setting.setup_question.lower() and 'disabled' in setting.setup_question.lower())):
-                            setting.options = [('1', 'Enabled', v == 1), ('0', 'Disabled', v == 0)]
-                            setting.is_numeric = False
-                            # Set current_value as string for consistency
-                            setting.current_value = str(value_val)
-                        else:
-                            setting.is_numeric = True
-                    else:
-                        setting.is_numeric = True
-                except Exception:
-                    setting.is_numeric = True
+            # Value settings are numeric until _infer_enable_disable_options runs after parsing
+            if has_value:
+                setting.is_numeric = True
             # Set default current value if not set
             if not setting.current_value and setting.options:
                 # Find the option marked with * or use first option
@@ -302,24 +617,31 @@ class OptimizedNVRAMParser:
             # Validate required fields
             if not setting.setup_question or not setting.token:
                 return None
+            # Lowercased search text, built once so searches don't re-lower every field
+            setting._search_blob = (setting.setup_question + '\0' + setting.help_string + '\0' + setting.token).lower()
+            # Question truncated for tree rows and search result buttons
+            q = setting.setup_question
+            setting._display_label = q if len(q) <= 60 else q[:60] + "..."
             return setting
         except Exception:
             return None  # Skip malformed settings
     
     def _extract_value(self, line):
         """Extract value after = sign"""
-        if '=' in line:
-            return line.split('=', 1)[1].strip()
-        return ""
+        _, sep, value = line.partition('=')
+        return value.strip() if sep else ""
     
     def _process_option_line(self, setting, line):
         """Process option line with regex optimization"""
+        # Cheap substring check before running the option regex
+        if '[' not in line or ']' not in line:
+            return
         try:
             is_current = '*' in line
             clean_line = line.replace('*', '', 1) if is_current else line
             
             # Extract option with optimized regex
-            match = re.search(r'\[([^\]]+)\]([^//\n]*)', clean_line)
+            match = _RE_OPTION.search(clean_line)
             if match:
                 value = match.group(1).strip()
                 description = match.group(2).strip()
@@ -331,13 +653,124 @@ class OptimizedNVRAMParser:
             pass  # Skip malformed options
 
 
+def _parse_blocks_batch(blocks):
+    """Worker process entry point: parse decoded blocks into field tuples (None for skipped blocks).
+    
+    Plain tuples are returned because settings pickled in a spawned worker would
+    reference the worker's __mp_main__ module, which the GUI process cannot import.
+    """
+    parser = OptimizedNVRAMParser()
+    results = []
+    for block in blocks:
+        setting = parser._parse_setting_block(block)
+        results.append(setting.to_fields() if setting else None)
+    return results
+
+
+class SettingCard:
+    """Widgets for one setting in the settings view, rebound to other settings instead of rebuilt"""
+    
+    def __init__(self, app, parent):
+        self.app = app
+        self.setting = None
+        self.index = None
+        # Every widget a setting can need is created once; bind_setting packs the ones in use
+        self.frame = ttk.LabelFrame(parent, padding=8)
+        self.help_label = ttk.Label(self.frame, foreground="gray", font=("Arial", 8))
+        self.tech_label = ttk.Label(self.frame, font=("Consolas", 7))
+        self.ignored_label = ttk.Label(self.frame, text="This setting is ignored (commented out in BIOS file)",
+                                       font=("Arial", 9, "italic"), foreground="gray")
+        self.value_frame = ttk.Frame(self.frame)
+        self.goto_button = ttk.Button(self.value_frame, text="Go to", command=self._on_goto)
+        self.combo = ttk.Combobox(self.value_frame, state="readonly", width=60)
+        self.combo.bind("<<ComboboxSelected>>", self._on_combo_change)
+        self.entry = ttk.Entry(self.value_frame, width=30)
+        self.entry.bind('<FocusOut>', self._on_entry_change)
+        self.entry.bind('<Return>', self._on_entry_change)
+        self.numeric_label = ttk.Label(self.value_frame, text="(Numeric)", font=("Arial", 8), foreground="blue")
+    
+    def bind_setting(self, setting, index, show_goto=False):
+        """Show setting in this card; returns its input widget, or None for ignored settings"""
+        self.setting = setting
+        self.index = index
+        question = setting.setup_question[:80] + ("..." if len(setting.setup_question) > 80 else "")
+        # Ignore/commented-out settings (leading //): do not allow configuration
+        ignored = str(setting.setup_question).strip().startswith("//") or str(setting.token).strip().startswith("//")
+        self.frame.configure(text="[IGNORED] " + question if ignored else question)
+        # Only show help if not empty and not too long
+        help_text = setting.help_string[:200] + ("..." if len(setting.help_string) > 200 else "") if setting.help_string else ""
+        self.help_label.configure(text=help_text)
+        # Technical info in compact format
+        self.tech_label.configure(text=f"Token: {setting.token} | Offset: {setting.offset} | Default: {setting.bios_default}",
+                                  foreground="gray" if ignored else "darkblue")
+        
+        # Repack the parts this setting uses, in display order
+        for child in (self.help_label, self.tech_label, self.ignored_label, self.value_frame):
+            child.pack_forget()
+        if help_text.strip():
+            self.help_label.pack(anchor=tk.W, pady=(0, 5))
+        self.tech_label.pack(anchor=tk.W, pady=(0, 5))
+        if ignored:
+            # Show as grayed-out, not editable
+            self.ignored_label.pack(anchor=tk.W, pady=(0, 5))
+            return None
+        self.value_frame.pack(fill=tk.X, pady=(5, 0))
+        for child in (self.goto_button, self.combo, self.entry, self.numeric_label):
+            child.pack_forget()
+        if show_goto:
+            self.goto_button.pack(side=tk.RIGHT, padx=(8, 0))
+        
+        current_value = str(setting.current_value)
+        options = setting.options
+        # Dropdown for small option sets (2-10, even if numeric) and for any non-numeric option set;
+        # numeric fields with no or too many options use a free-entry field
+        if options and (2 <= len(options) <= 10 or not setting.is_numeric):
+            values, labels = setting.combo_choices()
+            self.combo.configure(values=labels)
+            try:
+                self.combo.current(values.index(current_value))
+            except ValueError:
+                # fallback: set to current_value as string
+                self.combo.set(current_value)
+            self.combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            return self.combo
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, current_value)
+        self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        if setting.is_numeric:
+            self.numeric_label.pack(side=tk.LEFT, padx=(5, 0))
+        return self.entry
+    
+    def _on_goto(self):
+        self.app.goto_setting_in_main(self.index)
+    
+    def _on_combo_change(self, event=None):
+        sel = self.combo.get()
+        # Extract value from "value : desc"
+        if ' : ' in sel:
+            val = sel.split(' : ')[0].strip()
+        elif ' - ' in sel:
+            val = sel.split(' - ')[0].strip()
+        else:
+            val = sel.strip()
+        self.app.apply_setting_value(self.setting, val)
+    
+    def _on_entry_change(self, event=None):
+        # Focus can leave an entry without an edit; only real changes are recorded
+        val = self.entry.get()
+        if val != str(self.setting.current_value):
+            self.app.apply_setting_value(self.setting, val)
+
+
 class LazyLoadTreeview:
     """Optimized Treeview with lazy loading for better performance"""
     
     def __init__(self, parent, settings_callback):
         self.parent = parent
         self.settings_callback = settings_callback
-        self.visible_items = {}
+        # Row kind and payload live on the Treeview items themselves (tags/values);
+        # only the per-category index lists are kept here, one entry per category
+        self.category_indices = {}
         self.item_cache = {}
         
         # Create treeview with virtual scrolling
@@ -351,24 +784,22 @@ class LazyLoadTreeview:
     def populate(self, categories):
         """Populate tree with category nodes only"""
         self.tree.delete(*self.tree.get_children())
-        self.visible_items.clear()
+        self.category_indices = dict(categories)
         self.item_cache.clear()
         
         for category, setting_indices in categories.items():
             count = len(setting_indices)
             category_text = f"{category} ({count} settings)"
-            category_item = self.tree.insert('', 'end', text=category_text, values=(category,))
-            self.visible_items[category_item] = ('category', category, setting_indices)
+            self.tree.insert('', 'end', text=category_text, values=(category,), tags=('category',))
     
     def _on_selection(self, event):
         """Handle tree selection with lazy loading"""
         selection = self.tree.selection()
         if selection:
             item = selection[0]
-            if item in self.visible_items:
-                item_type, data, extra = self.visible_items[item]
-                if item_type == 'category':
-                    self._load_category_children(item, data, extra)
+            if 'category' in self.tree.item(item, 'tags'):
+                category = str(self.tree.item(item, 'values')[0])
+                self._load_category_children(item, category, self.category_indices.get(category, []))
     
     def _load_category_children(self, category_item, category_name, setting_indices):
         """Lazy load category children when expanded"""
@@ -376,31 +807,44 @@ class LazyLoadTreeview:
         if self.tree.get_children(category_item):
             return
         
-        # Load first 50 settings to avoid UI freeze
-        batch_size = 50
-        for i, setting_index in enumerate(setting_indices[:batch_size]):
-            setting = self.settings_callback(setting_index)
-            if setting:
-                setting_text = setting.setup_question[:60] + ("..." if len(setting.setup_question) > 60 else "")
-                setting_item = self.tree.insert(category_item, 'end', text=setting_text)
-                self.visible_items[setting_item] = ('setting', setting, setting_index)
-        
-        # Add "Load More" if there are more settings
-        if len(setting_indices) > batch_size:
-            remaining = len(setting_indices) - batch_size
-            load_more_item = self.tree.insert(category_item, 'end', text=f"Load {remaining} more settings...")
-            self.visible_items[load_more_item] = ('load_more', category_name, setting_indices[batch_size:])
+        # Detach the category while its children are inserted so the tree only redraws once
+        parent = self.tree.parent(category_item)
+        position = self.tree.index(category_item)
+        selection = self.tree.selection()
+        self.tree.detach(category_item)
+        try:
+            # Load first 50 settings to avoid UI freeze
+            batch_size = 50
+            settings_callback = self.settings_callback
+            rows = [(setting_index, setting._display_label)
+                    for setting_index, setting in ((i, settings_callback(i)) for i in setting_indices[:batch_size])
+                    if setting]
+            # Call the Tcl insert command directly: Treeview.insert re-parses its keyword
+            # options on every call, and these rows all share the same option layout
+            call = self.tree.tk.call
+            tree_path = str(self.tree)
+            for setting_index, label in rows:
+                call(tree_path, 'insert', category_item, 'end',
+                     '-text', label, '-values', (setting_index,), '-tags', ('setting',))
+            
+            # Add "Load More" if there are more settings
+            if len(setting_indices) > batch_size:
+                remaining = len(setting_indices) - batch_size
+                self.tree.insert(category_item, 'end', text=f"Load {remaining} more settings...",
+                                 values=(category_name, batch_size), tags=('load_more',))
+        finally:
+            self.tree.move(category_item, parent, position)
+            if selection:
+                self.tree.selection_set(selection)
     
     def _on_double_click(self, event):
         """Handle double-click for edit action"""
         selection = self.tree.selection()
         if selection:
             item = selection[0]
-            if item in self.visible_items:
-                item_type, data, extra = self.visible_items[item]
-                if item_type == 'setting':
-                    # Trigger setting edit
-                    return data
+            if 'setting' in self.tree.item(item, 'tags'):
+                # Trigger setting edit
+                return self.settings_callback(int(self.tree.item(item, 'values')[0]))
 
 
 class EnhancedBIOSSettingsGUI:
@@ -410,35 +854,43 @@ class EnhancedBIOSSettingsGUI:
         for setting in self.settings:
             # Validate options
             if getattr(setting, 'original_has_options', False) and setting.options:
-                # Collect all possible values
-                allowed_values = [str(v) for v, _, _ in setting.options]
+                # Option value strings are built once per setting and reused across validations
+                allowed_values = setting.combo_choices()[0]
                 current_value = str(setting.current_value)
                 # Check that current_value is in allowed options
-                if current_value not in allowed_values:
+                if not setting.is_option_value(current_value):
                     errors.append(f"Setting '{setting.setup_question}': Current value '{current_value}' is not a valid option. Allowed: {allowed_values}")
                 # Check that exactly one option is marked as current
-                star_count = 0
-                for v, _, _ in setting.options:
-                    if str(v) == current_value:
-                        star_count += 1
+                star_count = allowed_values.count(current_value)
                 if star_count != 1:
                     errors.append(f"Setting '{setting.setup_question}': Exactly one option must be selected, found {star_count}.")
             # Validate value lines
             elif not getattr(setting, 'original_has_options', False):
-                # Try to infer allowed range from help string (e.g., 'range:0 ~ 31')
-                value = str(setting.current_value)
-                if hasattr(setting, 'help_string') and setting.help_string:
-                    import re
-                    m = re.search(r'range[:=]?\s*(\d+)\s*[~\-]\s*(\d+)', setting.help_string)
-                    if m:
-                        minv, maxv = int(m.group(1)), int(m.group(2))
-                        try:
-                            v = int(value, 0)
-                            if not (minv <= v <= maxv):
-                                errors.append(f"Setting '{setting.setup_question}': Value {v} is out of allowed range {minv}~{maxv}.")
-                        except Exception:
-                            errors.append(f"Setting '{setting.setup_question}': Value '{value}' is not a valid integer.")
+                # Try to infer allowed range from help string (e.g., 'range:0 ~ 31'), parsed once per setting
+                value_range = setting.value_range()
+                if value_range:
+                    minv, maxv = value_range
+                    value = str(setting.current_value)
+                    try:
+                        v = int(value, 0)
+                        if not (minv <= v <= maxv):
+                            errors.append(f"Setting '{setting.setup_question}': Value {v} is out of allowed range {minv}~{maxv}.")
+                    except Exception:
+                        errors.append(f"Setting '{setting.setup_question}': Value '{value}' is not a valid integer.")
         return errors
+    def _schedule_search(self, *args):
+        """Trace handler for the inline search box: run the search once typing pauses for 150 ms."""
+        if self._suppress_search_trace:
+            return
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._run_search)
+
+    def _run_search(self):
+        """Run the debounced inline search."""
+        self._search_after_id = None
+        self.on_inline_search_changed()
+
     def on_inline_search_changed(self, *args):
         """Handler for inline search box. Filters settings and displays results in main area. Now uses fuzzy matching if available."""
         # Prevent error if scrollable_frame is not yet created
@@ -451,32 +903,30 @@ class EnhancedBIOSSettingsGUI:
             self.load_page_settings(page)
             return
         # Try to use rapidfuzz for fuzzy matching, else fallback to substring
-        try:
-            from rapidfuzz import fuzz
-            def fuzzy_score(s):
-                return max(
-                    fuzz.partial_ratio(search_text, str(s.setup_question).lower()),
-                    fuzz.partial_ratio(search_text, str(s.help_string).lower()),
-                    fuzz.partial_ratio(search_text, str(s.token).lower())
-                )
-            scored = [(i, setting, fuzzy_score(setting)) for i, setting in enumerate(self.settings)]
-            # Only keep those with score >= 60 (tune as needed)
-            filtered = [(i, s) for i, s, score in scored if score >= 60]
-            # Sort by best match
-            matched_settings = sorted(filtered, key=lambda x: -fuzzy_score(x[1]))
-        except ImportError:
+        rapidfuzz = _load_rapidfuzz()
+        if rapidfuzz:
+            fuzz, process = rapidfuzz
+            # One batched call per field over the precomputed corpus; a setting
+            # scores its best field. Only keep those with score >= 60 (tune as needed)
+            best = {}
+            for corpus in self._search_corpus:
+                for _, score, i in process.extract(search_text, corpus, scorer=fuzz.partial_ratio,
+                                                   score_cutoff=60, limit=None):
+                    if score > best.get(i, 0):
+                        best[i] = score
+            # Sort by best match on the stored (index, score) pairs
+            ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+            matched_settings = [(i, self.settings[i]) for i, _ in ranked]
+        else:
             # Fallback: substring match
             matched_settings = []
             for i, setting in enumerate(self.settings):
-                if (search_text in str(setting.setup_question).lower() or
-                    search_text in str(setting.help_string).lower() or
-                    search_text in str(setting.token).lower()):
+                if search_text in setting._search_blob:
                     matched_settings.append((i, setting))
         if not matched_settings:
             # Clear display
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
-            label = ttk.Label(self.scrollable_frame, text="No matches found.", font=("Arial", 12), foreground="gray")
+            self._clear_settings_view()
+            label = ttk.Label(self._settings_container, text="No matches found.", font=("Arial", 12), foreground="gray")
             label.pack(pady=40)
             return
         # Show first batch (20) with lazy loading
@@ -489,30 +939,20 @@ class EnhancedBIOSSettingsGUI:
         if widget:
             widget.focus_set()
             try:
-                self.canvas.update_idletasks()
-                # Get widget's position and size relative to the scrollable_frame
-                widget_y = widget.winfo_y()
+                # Callers schedule this after the loaded page has been laid out, so geometry is
+                # current without another update_idletasks; each measurement is read once.
+                # The input widget sits inside its card, so its y is taken relative to scrollable_frame
+                widget_y = widget.winfo_rooty() - self.scrollable_frame.winfo_rooty()
                 widget_h = widget.winfo_height()
-                frame_h = self.scrollable_frame.winfo_height()
                 canvas_h = self.canvas.winfo_height()
-                # Get the current top of the visible area in the scrollable_frame
+                scroll_range = max(1, self.scrollable_frame.winfo_height() - canvas_h)
+                # Current top of the visible area in the scrollable_frame
                 y0 = int(self.canvas.canvasy(0))
-                y1 = y0 + canvas_h
-                # If widget is above the visible area, scroll so its top is at the top
-                if widget_y < y0:
-                    # Scroll so the widget's top is at the top of the visible area
-                    scroll_fraction = widget_y / max(1, frame_h - canvas_h)
-                    self.canvas.yview_moveto(max(0, min(1, scroll_fraction)))
-                # If widget is below the visible area, scroll so its bottom is at the bottom
-                elif widget_y + widget_h > y1:
-                    # Scroll so the widget's bottom is at the bottom of the visible area
-                    scroll_fraction = (widget_y + widget_h - canvas_h) / max(1, frame_h - canvas_h)
-                    self.canvas.yview_moveto(max(0, min(1, scroll_fraction)))
-                # If widget is partially visible (top above, bottom below), scroll so it's fully visible
-                elif widget_y < y0 and widget_y + widget_h > y1:
-                    scroll_fraction = widget_y / max(1, frame_h - canvas_h)
-                    self.canvas.yview_moveto(max(0, min(1, scroll_fraction)))
-                # Otherwise, already fully visible; do nothing
+                # Scroll only if the widget is not fully visible: align its top when it is above
+                # the visible area, otherwise its bottom
+                if widget_y < y0 or widget_y + widget_h > y0 + canvas_h:
+                    target = widget_y if widget_y < y0 else widget_y + widget_h - canvas_h
+                    self.canvas.yview_moveto(max(0, min(1, target / scroll_range)))
             except Exception:
                 # As a fallback, use bbox to scroll the widget into view
                 try:
@@ -538,9 +978,23 @@ class EnhancedBIOSSettingsGUI:
                 except Exception:
                     pass
             self.root.after(1200, remove_highlight)
+    def _search_pattern(self, search_text):
+        """Compiled case-insensitive pattern matching any word of search_text, from a small LRU cache"""
+        cache = self._search_pattern_cache
+        pattern = cache.get(search_text)
+        if pattern is not None:
+            cache.move_to_end(search_text)
+            return pattern
+        # One alternation highlights every word in a single scan; longer words are tried
+        # first so a word that contains another is highlighted whole
+        words = sorted(set(search_text.split()), key=len, reverse=True)
+        pattern = cache[search_text] = re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+        if len(cache) > 32:
+            cache.popitem(last=False)
+        return pattern
+    
     def show_search_results_view(self, matched_settings):
         """Show a dedicated search results popup window with highlighted matches."""
-        import re
         # If a previous popup exists, destroy it
         if hasattr(self, '_search_popup') and self._search_popup:
             try:
@@ -561,121 +1015,90 @@ class EnhancedBIOSSettingsGUI:
             ttk.Label(frame, text="No matches found.", font=("Arial", 12), foreground="gray").pack(pady=40)
             ttk.Button(frame, text="Close", command=self.hide_search_results_view).pack(pady=10)
             return
-        # Scrollable results list
-        results_canvas = tk.Canvas(frame, borderwidth=0, highlightthickness=0)
-        results_scroll = ttk.Scrollbar(frame, orient="vertical", command=results_canvas.yview)
-        results_frame = ttk.Frame(results_canvas)
-        results_canvas.create_window((0, 0), window=results_frame, anchor="nw")
-        results_canvas.configure(yscrollcommand=results_scroll.set, height=350)
-        results_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # One read-only Text widget holds every result: matches are tagged spans and the
+        # selection is a tagged line range, instead of a frame, labels and a button per result
+        results_text = tk.Text(frame, wrap=tk.WORD, height=20, cursor="arrow",
+                               borderwidth=0, highlightthickness=0)
+        results_scroll = ttk.Scrollbar(frame, orient="vertical", command=results_text.yview)
+        results_text.configure(yscrollcommand=results_scroll.set)
+        results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         results_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        def on_frame_configure(event):
-            results_canvas.configure(scrollregion=results_canvas.bbox("all"))
-        results_frame.bind("<Configure>", on_frame_configure)
+        # Later tags win, so match highlighting stays visible on the selected result
+        results_text.tag_configure("question", font=("Arial", 10), spacing1=3)
+        results_text.tag_configure("help", font=("Arial", 8), foreground="gray", lmargin1=20, lmargin2=20)
+        results_text.tag_configure("selected", background="#cce6ff")
+        results_text.tag_configure("match", font=("Arial", 10, "bold"), background="#ffe066")
+        results_text.tag_configure("help_match", font=("Arial", 8, "bold"), background="#ffe066")
         # Highlight all search terms in results
         search_text = self.inline_search_var.get().strip().lower()
-        pattern = re.compile(re.escape(search_text), re.IGNORECASE) if search_text else None
+        pattern = self._search_pattern(search_text) if search_text else None
+        def highlighted(text, tag, match_tag):
+            # (text, tags) pairs for Text.insert
+            args = []
+            for literal, match in _iter_highlight_spans(pattern, text):
+                if literal:
+                    args += (literal, tag)
+                if match:
+                    args += (match, (tag, match_tag))
+            return args
+        # First text line of each result, for mapping clicks and selection to results
+        result_lines = []
+        line = 1
+        for i, setting in matched_settings:
+            result_lines.append(line)
+            args = highlighted(str(setting.setup_question) if pattern else setting._display_label,
+                               "question", "match")
+            args += ("\n", "question")
+            # Highlight matches in help_string
+            if setting.help_string:
+                hs = str(setting.help_string)
+                if not pattern:
+                    hs = hs[:80] + ("..." if len(hs) > 80 else "")
+                args += highlighted(hs, "help", "help_match")
+                args += ("\n", "help")
+            line += sum(chunk.count("\n") for chunk in args[::2])
+            results_text.insert(tk.END, *args)
+        results_text.configure(state=tk.DISABLED)
         # --- Keyboard navigation state ---
-        self._search_result_btns = []
-        self._search_result_btn_frames = []
         self._search_result_selected = 0
         def select_result(idx):
-            # Remove highlight from all
-            for f in self._search_result_btn_frames:
-                try:
-                    f.config(style="TFrame")
-                except Exception:
-                    pass
-            # Highlight selected
-            if 0 <= idx < len(self._search_result_btn_frames):
-                try:
-                    self._search_result_btn_frames[idx].config(style="Selected.TFrame")
-                except Exception:
-                    pass
-                try:
-                    self._search_result_btns[idx].focus_set()
-                except Exception:
-                    pass
+            results_text.tag_remove("selected", "1.0", tk.END)
+            start = f"{result_lines[idx]}.0"
+            end = f"{result_lines[idx + 1]}.0" if idx + 1 < len(result_lines) else tk.END
+            results_text.tag_add("selected", start, end)
+            results_text.see(start)
             self._search_result_selected = idx
-        style = ttk.Style()
-        style.configure("Selected.TFrame", background="#cce6ff")
-        for idx, (i, setting) in enumerate(matched_settings):
-            sq = str(setting.setup_question)
-            if pattern and search_text:
-                parts = pattern.split(sq)
-                matches = pattern.findall(sq)
-                btn_frame = ttk.Frame(results_frame)
-                btn_frame.pack(fill=tk.X, padx=10, pady=3)
-                for j, part in enumerate(parts):
-                    if part:
-                        lbl = ttk.Label(btn_frame, text=part, font=("Arial", 10))
-                        lbl.pack(side=tk.LEFT, anchor=tk.W)
-                    if j < len(matches):
-                        hl = ttk.Label(btn_frame, text=matches[j], font=("Arial", 10, "bold"), background="#ffe066")
-                        hl.pack(side=tk.LEFT, anchor=tk.W)
-                btn = ttk.Button(btn_frame, text="Go", style="Action.TButton", cursor="hand2", command=lambda idx=i: self.on_search_result_selected(idx))
-                btn.pack(side=tk.RIGHT, padx=5)
-                self._search_result_btns.append(btn)
-                self._search_result_btn_frames.append(btn_frame)
-            else:
-                btn = ttk.Button(results_frame, text=f"{sq[:60]}" + ("..." if len(sq) > 60 else ""),
-                                style="Action.TButton", cursor="hand2",
-                                command=lambda idx=i: self.on_search_result_selected(idx))
-                btn.pack(fill=tk.X, padx=10, pady=3)
-                self._search_result_btns.append(btn)
-                self._search_result_btn_frames.append(btn)
-            # Highlight matches in help_string
-            if setting.help_string:
-                hs = str(setting.help_string)
-                if pattern and search_text:
-                    parts = pattern.split(hs)
-                    matches = pattern.findall(hs)
-                    help_frame = ttk.Frame(results_frame)
-                    help_frame.pack(fill=tk.X, padx=30, anchor=tk.W)
-                    for j, part in enumerate(parts):
-                        if part:
-                            lbl = ttk.Label(help_frame, text=part, font=("Arial", 8), foreground="gray")
-                            lbl.pack(side=tk.LEFT, anchor=tk.W)
-                        if j < len(matches):
-                            hl = ttk.Label(help_frame, text=matches[j], font=("Arial", 8, "bold"), background="#ffe066", foreground="gray")
-                            hl.pack(side=tk.LEFT, anchor=tk.W)
-                else:
-                    lbl = ttk.Label(results_frame, text=hs[:80] + ("..." if len(hs) > 80 else ""), font=("Arial", 8), foreground="gray")
-                    lbl.pack(fill=tk.X, padx=30, anchor=tk.W)
+        def result_at(event):
+            line = int(results_text.index(f"@{event.x},{event.y}").split(".")[0])
+            return max(0, bisect.bisect_right(result_lines, line) - 1)
+        def on_click(event):
+            select_result(result_at(event))
+            return "break"
+        def on_double_click(event):
+            self.on_search_result_selected(matched_settings[result_at(event)][0])
+            return "break"
+        results_text.bind("<Button-1>", on_click)
+        results_text.bind("<Double-Button-1>", on_double_click)
         # Initial highlight
-        if self._search_result_btn_frames:
-            select_result(0)
+        select_result(0)
         def on_key(event):
-            if not self._search_result_btns:
-                return
             idx = self._search_result_selected
-            # Handle Enter key to open dropdown or trigger "Go" button
+            # Handle Enter key to go to the selected setting
             if event.keysym in ("Return", "KP_Enter"):
-                if self._search_result_btns[idx].cget("text") == "Go":
-                    self._search_result_btns[idx].invoke()
-                else:
-                    self._search_result_btns[idx].event_generate("<Button-1>")
+                self.on_search_result_selected(matched_settings[idx][0])
                 return "break"
             elif event.keysym in ("Down", "Tab"):
-                idx = (idx + 1) % len(self._search_result_btns)
+                idx = (idx + 1) % len(result_lines)
                 select_result(idx)
                 return "break"
             elif event.keysym == "Up":
-                idx = (idx - 1) % len(self._search_result_btns)
+                idx = (idx - 1) % len(result_lines)
                 select_result(idx)
                 return "break"
 
-        # Bind to all widgets in popup so Enter always works, including Entry
-        widgets_to_bind = [self._search_popup]
-        for child in self._search_popup.winfo_children():
-            if isinstance(child, tk.Toplevel):
-                widgets_to_bind.append(child)
-            try:
-                widgets_to_bind.extend(c for c in child.winfo_children() if isinstance(c, tk.Toplevel))
-            except Exception:
-                pass
-        for w in widgets_to_bind:
-            w.bind("<KeyPress>", on_key, add="+")
+        # Every widget in the popup carries the toplevel in its bindtags, so one binding
+        # here sees key presses from all of them (including Entry) without touching "all"
+        self._search_popup.bind("<KeyPress>", on_key)
         ttk.Button(frame, text="Cancel Search", command=self.hide_search_results_view).pack(pady=10)
 
     def hide_search_results_view(self):
@@ -700,86 +1123,76 @@ class EnhancedBIOSSettingsGUI:
         """Show a dialog summarizing all changes before import, with user-friendly option descriptions."""
         changes = []
         for setting in self.settings:
-            orig_value = getattr(setting, 'original_value', setting.current_value)
+            # Only edited settings can differ from their original value
+            if not setting.dirty:
+                continue
+            orig_value = setting.original_value
             curr_value = setting.current_value
             if str(orig_value) != str(curr_value):
                 # If options exist, show the description instead of just the value
-                def get_desc(val):
-                    if hasattr(setting, 'options') and setting.options:
-                        for v, desc, *_ in setting.options:
-                            if str(v) == str(val):
-                                return f"{desc} ({val})"
-                    return str(val)
-                changes.append((setting.setup_question, get_desc(orig_value), get_desc(curr_value)))
+                changes.append((setting.setup_question, setting.describe_value(orig_value),
+                                setting.describe_value(curr_value)))
         if not changes:
             messagebox.showinfo("No Changes", "No changes to review.")
             return False
         # Build review text
-        review_text = "The following changes will be applied to the BIOS:\n\n"
+        parts = ["The following changes will be applied to the BIOS:\n\n"]
         for q, old, new in changes:
-            review_text += f"- {q}\n    Old: {old}\n    New: {new}\n\n"
-        return messagebox.askyesno("Review Changes", review_text + "\nProceed with import?")
-
-    def push_undo(self):
-        """Push current state to the undo stack and clear redo stack. Limit stack size for memory efficiency."""
-        snapshot = [(s.token, s.current_value) for s in self.settings]
-        self.undo_stack.append(snapshot)
-        # Limit undo stack size
-        max_undo = 30
-        if len(self.undo_stack) > max_undo:
-            self.undo_stack = self.undo_stack[-max_undo:]
-        if hasattr(self, 'redo_stack'):
-            self.redo_stack.clear()
-        else:
-            self.redo_stack = []
+            parts.append(f"- {q}\n    Old: {old}\n    New: {new}\n\n")
+        parts.append("\nProceed with import?")
+        return messagebox.askyesno("Review Changes", "".join(parts))
+
+    def push_undo(self, setting, old_value):
+        """Record a (setting, old, new) change on the undo stack and clear redo stack. Call after the value is set."""
+        # The setting itself is kept rather than its token: tokens are not unique across settings,
+        # and both stacks are cleared whenever a file is loaded
+        self.undo_stack.append((setting, old_value, setting.current_value))
+        self.redo_stack.clear()
 
     def undo(self):
         """Undo the last change and push to redo stack."""
         if not self.undo_stack:
             messagebox.showinfo("Undo", "Nothing to undo.")
             return
-        # Save current state to redo stack
-        if not hasattr(self, 'redo_stack'):
-            self.redo_stack = []
-        current_snapshot = [(s.token, s.current_value) for s in self.settings]
-        self.redo_stack.append(current_snapshot)
-        # Restore previous state from undo stack
-        last_state = self.undo_stack.pop()
-        token_to_value = dict(last_state)
-        for s in self.settings:
-            if s.token in token_to_value:
-                s.current_value = token_to_value[s.token]
+        # Revert the last change and keep it for redo
+        change = self.undo_stack.pop()
+        setting, old_value, _ = change
+        # Reverting can make the setting differ from what the BIOS holds, so it goes
+        # through the same review bookkeeping as an edit
+        self._set_current_value(setting, old_value)
+        self.redo_stack.append(change)
         self.on_inline_search_changed()
 
     def redo(self):
-        """Redo the last undone change. Limit redo stack size for memory efficiency."""
-        if not hasattr(self, 'redo_stack') or not self.redo_stack:
+        """Redo the last undone change."""
+        if not self.redo_stack:
             messagebox.showinfo("Redo", "Nothing to redo.")
             return
-        # Save current state to undo stack
-        current_snapshot = [(s.token, s.current_value) for s in self.settings]
-        self.undo_stack.append(current_snapshot)
-        # Limit undo stack size
-        max_undo = 30
-        if len(self.undo_stack) > max_undo:
-            self.undo_stack = self.undo_stack[-max_undo:]
-        # Restore state from redo stack
-        redo_state = self.redo_stack.pop()
-        token_to_value = dict(redo_state)
-        for s in self.settings:
-            if s.token in token_to_value:
-                s.current_value = token_to_value[s.token]
+        # Reapply the last undone change and move it back to the undo stack
+        change = self.redo_stack.pop()
+        setting, _, new_value = change
+        self._set_current_value(setting, new_value)
+        self.undo_stack.append(change)
         self.on_inline_search_changed()
 
     def restore_last_backup(self):
         """Restore the most recent NVRAM backup from the temp directory."""
-        import glob
         temp_dir = os.path.join(tempfile.gettempdir(), "scewin_temp")
-        backup_files = sorted(glob.glob(os.path.join(temp_dir, "nvram_backup_*.txt")), reverse=True)
-        if not backup_files:
+        # Backup names embed a %Y%m%d_%H%M%S timestamp, so the greatest name is the newest
+        latest_name = None
+        try:
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name.startswith("nvram_backup_") and name.endswith(".txt")
+                            and (latest_name is None or name > latest_name)):
+                        latest_name = name
+        except OSError:
+            pass
+        if latest_name is None:
             messagebox.showinfo("Restore Backup", "No backup files found.")
             return
-        last_backup = backup_files[0]
+        last_backup = os.path.join(temp_dir, latest_name)
         if not messagebox.askyesno("Restore Backup", f"Restore the most recent backup?\n\n{last_backup}\n\nThis will overwrite your current NVRAM file in the temp directory."):
             return
         nvram_txt = os.path.join(temp_dir, "nvram.txt")
@@ -802,27 +1215,35 @@ class EnhancedBIOSSettingsGUI:
         self.parser = OptimizedNVRAMParser()
         self.settings = []  # Only store current settings in memory
         self.setting_widgets = {}  # Only keep widgets for currently visible settings
+        # SettingCards shown in the settings view by setting index, and unpacked ones ready for reuse
+        self._cards_in_use = {}
+        self._card_pool = []
+        self._load_more_btn = None  # "Load More" button at the end of the settings view, if shown
         self.original_file_path = ""
         self.operation_queue = queue.Queue()
         self.current_progress = None
-        self.undo_stack = []
-        self.redo_stack = []
-        # Advanced optimization: cache for settings batches (for lazy loading)
-        self._settings_batch_cache = {}
-        # Advanced optimization: track last access for LRU purging
-        self._batch_access_times = {}
+        # Bounded history of (setting, old_value, new_value) changes; deque drops the oldest itself
+        self.undo_stack = deque(maxlen=200)
+        self.redo_stack = deque(maxlen=200)
+        # Lowercased (questions, help strings, tokens) lists for fuzzy search, rebuilt on load
+        self._search_corpus = ([], [], [])
+        # Pending debounced search (root.after id) and placeholder-edit guard for the search box
+        self._search_after_id = None
+        self._suppress_search_trace = False
+        # Advanced optimization: LRU cache for settings batches (for lazy loading), oldest first
+        self._settings_batch_cache = OrderedDict()
+        # Highlight patterns by search text for the search results popup, oldest first
+        self._search_pattern_cache = OrderedDict()
         self._max_batches_in_memory = 5  # Tune as needed for memory/performance
+        # (settings list, words ranked by frequency, typed-filter index) last computed by update_category_menu
+        self._category_words_cache = (None, [], {})
+        # SCEWIN directory found by _resolve_scewin_dir, and SCEWIN.exe found by find_scetool_path
+        self._scewin_dir = None
+        self._scetool_path = None
 
         # Track the most recently changed token for highlight in raw view
         self._last_changed_token = None
 
-        # Reduce memory footprint by limiting thread stack size (if needed)
-        import threading
-        try:
-            threading.stack_size(2 * 1024 * 1024)  # 2MB per thread, adjust as needed
-        except Exception:
-            pass
-
         # Style configuration
         self.setup_styles()
         
@@ -926,16 +1347,23 @@ class EnhancedBIOSSettingsGUI:
 
         # --- Inline search box ---
         self.inline_search_var = tk.StringVar()
-        self.inline_search_var.trace_add('write', self.on_inline_search_changed)
+        self.inline_search_var.trace_add('write', self._schedule_search)
         search_entry = ttk.Entry(search_frame, textvariable=self.inline_search_var, font=("Arial", 10), width=28)
         search_entry.pack(fill=tk.X, pady=(0, 5))
+        # Adding or removing the placeholder is not a search
+        self._suppress_search_trace = True
         search_entry.insert(0, "Search BIOS settings...")
+        self._suppress_search_trace = False
         def clear_placeholder(event):
             if search_entry.get() == "Search BIOS settings...":
+                self._suppress_search_trace = True
                 search_entry.delete(0, tk.END)
+                self._suppress_search_trace = False
         def restore_placeholder(event):
             if not search_entry.get():
+                self._suppress_search_trace = True
                 search_entry.insert(0, "Search BIOS settings...")
+                self._suppress_search_trace = False
         search_entry.bind("<FocusIn>", clear_placeholder)
         search_entry.bind("<FocusOut>", restore_placeholder)
 
@@ -945,10 +1373,6 @@ class EnhancedBIOSSettingsGUI:
 
     def save_and_import_bios_with_review(self):
         """Show change review dialog and validate before importing to BIOS."""
-        # Save original values for review if not already present
-        for s in self.settings:
-            if not hasattr(s, 'original_value'):
-                s.original_value = s.current_value
         if not self.show_change_review_dialog():
             return
         # Advanced validation step
@@ -988,8 +1412,7 @@ class EnhancedBIOSSettingsGUI:
         self.scrollable_frame = ttk.Frame(canvas)
         
         # Configure scrolling
-        self.scrollable_frame.bind("<Configure>", 
-                                  lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        self.scrollable_frame.bind("<Configure>", self._update_scrollregion)
         
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -1005,12 +1428,40 @@ class EnhancedBIOSSettingsGUI:
         canvas.bind("<MouseWheel>", _on_mousewheel)
         self.canvas = canvas
         
+        # Settings widgets live in one container so clearing the view is a single destroy
+        self._settings_container = ttk.Frame(self.scrollable_frame)
+        self._settings_container.pack(fill=tk.BOTH, expand=True)
+        
         # Performance optimization: only show placeholder initially
-        placeholder = ttk.Label(self.scrollable_frame, 
+        placeholder = ttk.Label(self._settings_container, 
                                text="Load a NVRAM file to view settings", 
                                font=("Arial", 12), foreground="gray")
         placeholder.pack(expand=True, fill=tk.BOTH, pady=50)
     
+    def _update_scrollregion(self, event=None):
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def _clear_settings_view(self, pack=True):
+        """Remove all settings widgets by destroying their container once and starting a fresh one.
+        With pack=False the new container is left unpacked so a whole batch can be filled in
+        before it is laid out; _show_settings_container packs it afterwards."""
+        # Setting cards are not children of the container: destroying it only unpacks them
+        self._card_pool.extend(self._cards_in_use.values())
+        self._cards_in_use.clear()
+        # Pooled widgets get rebound to other settings, so none of the old mappings stay valid
+        self.setting_widgets.clear()
+        self._settings_container.destroy()
+        # The container took its "Load More" button with it
+        self._load_more_btn = None
+        self._settings_container = ttk.Frame(self.scrollable_frame)
+        if pack:
+            self._settings_container.pack(fill=tk.BOTH, expand=True)
+    
+    def _show_settings_container(self):
+        """Pack a container filled while unpacked, so the batch costs one layout pass"""
+        self._settings_container.pack(fill=tk.BOTH, expand=True)
+        self.scrollable_frame.update_idletasks()
+    
     def setup_status_bar(self):
         """Setup enhanced status bar"""
         status_frame = ttk.Frame(self.root)
@@ -1024,30 +1475,68 @@ class EnhancedBIOSSettingsGUI:
         status_label.pack(fill=tk.X, padx=2, pady=2)
     
     # File operation methods with threading
-    def export_bios_and_load(self):
-        """Export BIOS settings and load them with progress tracking (user-writable temp dir)"""
-        possible_dirs = [
-            r"C:\\Program Files (x86)\\MSI\\MSI Center\\Lib\\SCEWIN\\5.05.01.0002",
-            r"C:\\Program Files\\MSI\\MSI Center\\Lib\\SCEWIN\\5.05.01.0002"
-        ]
-        scewin_dir = None
-        for d in possible_dirs:
+    def _resolve_scewin_dir(self):
+        """Locate MSI Center's SCEWIN directory, reusing the last result while it still holds SCEWIN_64.exe"""
+        if self._scewin_dir and os.path.isfile(os.path.join(self._scewin_dir, "SCEWIN_64.exe")):
+            return self._scewin_dir
+        self._scewin_dir = None
+        for d in _SCEWIN_DIRS:
             if os.path.isfile(os.path.join(d, "SCEWIN_64.exe")):
-                scewin_dir = d
+                self._scewin_dir = d
                 break
+        return self._scewin_dir
+
+    def _stage_scewin_files(self, temp_dir):
+        """Copy SCEWIN_64.exe and its drivers into temp_dir, skipping files already up to date there.
+        Shows an error and returns False if they cannot be found."""
+        scewin_dir = self._resolve_scewin_dir()
         if not scewin_dir:
             messagebox.showerror("Missing SCEWIN_64.exe", "Could not find SCEWIN_64.exe in known MSI Center locations.")
-            return
-        temp_dir = os.path.join(tempfile.gettempdir(), "scewin_temp")
-        os.makedirs(temp_dir, exist_ok=True)
-        files_to_copy = ["SCEWIN_64.exe", "amifldrv64.sys", "amigendrv64.sys"]
-        for fname in files_to_copy:
+            return False
+        for fname in _SCEWIN_FILES:
             src = os.path.join(scewin_dir, fname)
             dst = os.path.join(temp_dir, fname)
-            if not os.path.isfile(src):
+            try:
+                src_mtime = os.path.getmtime(src)
+            except OSError:
                 messagebox.showerror("Missing File", f"Required file not found: {src}")
-                return
+                return False
+            # copy2 keeps the source mtime, so an unchanged copy compares equal
+            try:
+                if os.path.getmtime(dst) >= src_mtime:
+                    continue
+            except OSError:
+                pass
             shutil.copy2(src, dst)
+        return True
+
+    def _run_scewin(self, cmd, cwd, progress, start, end):
+        """Run SCEWIN without a console window, advancing progress from start towards end as it prints.
+        Called from worker threads; progress updates are posted to the Tk thread.
+        Returns (returncode, combined stdout/stderr)."""
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, errors="replace",
+                                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        progress_callback = self._threadsafe_progress(progress)
+        output = []
+        last = None
+        with proc.stdout:
+            for line in proc.stdout:
+                output.append(line)
+                if line.strip():
+                    last = (min(end, start + len(output)), line.strip()[:60])
+                    progress_callback(*last)
+        # The throttle may have dropped the last line; always show it
+        if last:
+            self.root.after(0, progress.update_progress, *last)
+        return proc.wait(), "".join(output)
+
+    def export_bios_and_load(self):
+        """Export BIOS settings and load them with progress tracking (user-writable temp dir)"""
+        temp_dir = os.path.join(tempfile.gettempdir(), "scewin_temp")
+        os.makedirs(temp_dir, exist_ok=True)
+        if not self._stage_scewin_files(temp_dir):
+            return
         scewin_exe = os.path.join(temp_dir, "SCEWIN_64.exe")
         nvram_txt = os.path.join(temp_dir, "nvram.txt")
         log_file = os.path.join(temp_dir, "log-file.txt")
@@ -1056,23 +1545,21 @@ class EnhancedBIOSSettingsGUI:
             try:
                 progress = ProgressDialog(self.root, "Exporting BIOS", "Exporting BIOS settings to nvram.txt...")
                 progress.update_progress(10, "Cleaning up old files...")
-                for f in [nvram_txt, log_file]:
-                    if os.path.isfile(f):
-                        try:
-                            os.remove(f)
-                        except Exception:
-                            pass
+                # Anything but "already gone" (e.g. a locked nvram.txt) fails the export through the
+                # handler below, so a stale export is never loaded as if it were fresh
+                for f in (nvram_txt, log_file):
+                    try:
+                        os.remove(f)
+                    except FileNotFoundError:
+                        pass
                 progress.update_progress(30, "Running SCEWIN_64.exe export...")
                 cmd = [scewin_exe, "/o", "/s", "nvram.txt"]
-                result = subprocess.run(cmd, cwd=temp_dir, capture_output=True, text=True)
-                log_content = ""
-                if os.path.isfile(log_file):
-                    with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                        log_content = f.read()
-                if result.returncode != 0:
+                returncode, output = self._run_scewin(cmd, temp_dir, progress, 30, 85)
+                log_content = _safe_read(log_file)
+                if returncode != 0:
                     if progress: progress.close()
                     self.root.after(0, lambda: messagebox.showerror(
-                        "Export Failed", f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}\n\nLog:\n{log_content}"))
+                        "Export Failed", f"Output:\n{output}\n\nLog:\n{log_content}"))
                     return
                 if not os.path.isfile(nvram_txt):
                     if progress: progress.close()
@@ -1086,7 +1573,7 @@ class EnhancedBIOSSettingsGUI:
                 if progress: progress.close()
             except Exception as e:
                 if progress: progress.close()
-                self.root.after(0, lambda: messagebox.showerror("Export Error", str(e)))
+                self.root.after(0, messagebox.showerror, "Export Error", str(e))
         thread = threading.Thread(target=export_worker)
         thread.daemon = True
         thread.start()
@@ -1106,6 +1593,8 @@ class EnhancedBIOSSettingsGUI:
             return
         temp_dir = os.path.join(tempfile.gettempdir(), "scewin_temp")
         os.makedirs(temp_dir, exist_ok=True)
+        if not self._stage_scewin_files(temp_dir):
+            return
         scewin_exe = os.path.join(temp_dir, "SCEWIN_64.exe")
         nvram_txt = os.path.join(temp_dir, "nvram.txt")
         import_file = os.path.join(temp_dir, "nvram_import.txt")
@@ -1116,8 +1605,11 @@ class EnhancedBIOSSettingsGUI:
                 progress = ProgressDialog(self.root, "Importing to BIOS", "Preparing settings for import...")
                 progress.update_progress(10, "Generating NVRAM file...")
                 # Generate import file from current settings
-                if not self.generate_nvram_file(import_file, lambda p, s: progress.update_progress(10 + p * 0.4, s)):
-                    if progress: progress.close()
+                try:
+                    self.generate_nvram_file(import_file, self._threadsafe_progress(progress, 10, 40))
+                except Exception as e:
+                    progress.close()
+                    self.root.after(0, messagebox.showerror, "File Generation Error", f"Failed to generate NVRAM file: {str(e)}")
                     return
                 progress.update_progress(50, "Creating backup of exported NVRAM...")
                 backup_file = os.path.join(temp_dir, f"nvram_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
@@ -1125,13 +1617,13 @@ class EnhancedBIOSSettingsGUI:
                     shutil.copy2(nvram_txt, backup_file)
                 progress.update_progress(70, "Importing to BIOS with SCEWIN_64.exe...")
                 cmd = [scewin_exe, "/i", "/s", "nvram_import.txt"]
-                result = subprocess.run(cmd, cwd=temp_dir, capture_output=True, text=True)
-                log_content = ""
-                if os.path.isfile(log_file):
-                    with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                        log_content = f.read()
+                returncode, output = self._run_scewin(cmd, temp_dir, progress, 70, 95)
+                log_content = _safe_read(log_file)
                 if progress: progress.close()
-                if result.returncode == 0:
+                if returncode == 0:
+                    # The BIOS now holds these values; later edits are reviewed against them
+                    for s in self.settings:
+                        s.dirty = False
                     def show_success_with_restart():
                         win = tk.Toplevel(self.root)
                         win.title("Import Successful")
@@ -1162,10 +1654,10 @@ class EnhancedBIOSSettingsGUI:
                     self.status_var.set("✅ Settings imported successfully - Reboot recommended")                  
                 else:
                     self.root.after(0, lambda: messagebox.showerror(
-                        "Import Failed", f"Failed to import settings.\n\nSTDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}\n\nLog:\n{log_content}"))
+                        "Import Failed", f"Failed to import settings.\n\nOutput:\n{output}\n\nLog:\n{log_content}"))
             except Exception as e:
                 if progress: progress.close()
-                self.root.after(0, lambda: messagebox.showerror("Import Error", str(e)))
+                self.root.after(0, messagebox.showerror, "Import Error", str(e))
         thread = threading.Thread(target=import_worker)
         thread.daemon = True
         thread.start()
@@ -1186,64 +1678,82 @@ class EnhancedBIOSSettingsGUI:
     
     def load_file(self, file_path, existing_progress=None):
         """Load NVRAM file with optimized parsing and progress tracking"""
-        def load_worker():
-            progress = None  # Ensure progress is always defined
-            try:
-                # Create or use existing progress dialog
-                if existing_progress:
-                    progress = existing_progress
-                    progress.update_progress(85, "Parsing NVRAM file...")
-                else:
-                    progress = ProgressDialog(self.root, "Loading File", 
-                                            "Loading and parsing NVRAM file...")
-                
-                # Parse file with progress tracking
-                cancel_flag = lambda: getattr(progress, 'cancelled', False)
-                
-                def progress_callback(value, status=""):
-                    if not cancel_flag():
-                        base_progress = 85 if existing_progress else 0
-                        final_progress = base_progress + (value * (15 if existing_progress else 95) / 100)
-                        progress.update_progress(final_progress, status)
-                
-                self.settings = self.parser.parse_file(file_path, progress_callback, cancel_flag)
-                
-                if cancel_flag():
-                    return
-                
-                self.original_file_path = file_path
-    
-                # Reset setting widgets to avoid stale references
-                self.setting_widgets = {}
-    
-                # Update UI on main thread
-                self.root.after(0, lambda: self.finalize_load(file_path, progress))
-                
-            except Exception as e:
-                if existing_progress:
-                    existing_progress.close()
-                elif progress is not None:
-                    progress.close()
-                self.root.after(0, lambda: messagebox.showerror("Load Error", 
-                                f"Failed to load file: {str(e)}"))
+        # Create or use existing progress dialog
+        if existing_progress:
+            progress = existing_progress
+            progress.update_progress(85, "Parsing NVRAM file...")
+        else:
+            progress = ProgressDialog(self.root, "Loading File", 
+                                    "Loading and parsing NVRAM file...")
         
-        # Run in separate thread
-        thread = threading.Thread(target=load_worker)
+        # Parse in a separate thread; results are drained on the Tk thread.
+        # A fresh parser keeps the loaded file's header and categories intact until
+        # the new file has parsed successfully (not cancelled, no error)
+        parser = OptimizedNVRAMParser()
+        cancel_flag = lambda: getattr(progress, 'cancelled', False)
+        result_queue = queue.Queue()
+        thread = threading.Thread(target=parser.parse_file_async,
+                                  args=(file_path, result_queue, cancel_flag))
         thread.daemon = True
         thread.start()
+        self.root.after(50, self._poll_parse_queue, file_path, parser, result_queue, progress, bool(existing_progress))
+    
+    def _poll_parse_queue(self, file_path, parser, result_queue, progress, existing_progress=False):
+        """Apply queued parser progress/results on the Tk thread, rescheduling until parsing ends"""
+        if progress.cancelled:
+            return
+        try:
+            while True:
+                kind, value, status = result_queue.get_nowait()
+                if kind == 'progress':
+                    base_progress = 85 if existing_progress else 0
+                    final_progress = base_progress + (value * (15 if existing_progress else 95) / 100)
+                    progress.update_progress(final_progress, status)
+                    if progress.cancelled:
+                        return
+                elif kind == 'done':
+                    self.parser = parser
+                    self.settings = value
+                    self.original_file_path = file_path
+                    # Reset setting widgets to avoid stale references
+                    self.setting_widgets = {}
+                    self.finalize_load(file_path, progress)
+                    return
+                else:
+                    progress.close()
+                    messagebox.showerror("Load Error", f"Failed to load file: {str(value)}")
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(50, self._poll_parse_queue, file_path, parser, result_queue, progress, existing_progress)
     
     def finalize_load(self, file_path, progress):
         """Finalize file loading on main thread"""
         try:
             progress.update_progress(100, "Updating interface...")
-            # Update file info
-            filename = os.path.basename(file_path)
-            self.file_info_label.config(text=f"📄 {filename}\n🔢 {len(self.settings)} settings loaded")
-            # Remove page navigation, just update category menu
-            self.update_category_menu()
-            self.status_var.set(f"✅ Loaded {len(self.settings)} settings from {filename}")
-            # Show first batch of settings with lazy loading
-            self.display_lazy_loaded_settings()
+            self._search_corpus = tuple(
+                [str(getattr(s, field)).lower() for s in self.settings]
+                for field in ("setup_question", "help_string", "token")
+            )
+            # Undo history refers to the previous file's settings
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            # Hold scrollregion updates while the interface is rebuilt, then lay it out and
+            # size the scrollregion once
+            self.scrollable_frame.unbind("<Configure>")
+            try:
+                # Update file info
+                filename = os.path.basename(file_path)
+                self.file_info_label.config(text=f"📄 {filename}\n🔢 {len(self.settings)} settings loaded")
+                # Remove page navigation, just update category menu
+                self.update_category_menu()
+                self.status_var.set(f"✅ Loaded {len(self.settings)} settings from {filename}")
+                # Show first batch of settings with lazy loading
+                self.display_lazy_loaded_settings()
+                self.root.update_idletasks()
+            finally:
+                self.scrollable_frame.bind("<Configure>", self._update_scrollregion)
+            self._update_scrollregion()
             progress.close()
         except Exception as e:
             progress.close()
@@ -1257,36 +1767,72 @@ class EnhancedBIOSSettingsGUI:
         self._lazy_batch_size = batch_size
         self._lazy_keep_widgets = keep_widgets
         self._lazy_loaded_indices = set()
+        # Loaded indices in load order (ascending), so the oldest widgets are evicted from the left
+        self._lazy_loaded_order = deque()
         # Clear current display
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_settings_view()
         self.setting_widgets.clear()
         self._lazy_settings_total = len(self.settings)
         self._lazy_settings_widgets = []
-        self._lazy_settings_frame = self.scrollable_frame
+        self._lazy_settings_frame = self._settings_container
         # Use self.canvas as the scrollable Canvas
         self._lazy_settings_canvas = self.canvas
         self._lazy_settings_canvas.bind('<Configure>', self._on_lazy_scroll)
-        self._lazy_settings_canvas.bind_all('<MouseWheel>', self._on_lazy_scroll)
-        self._lazy_settings_canvas.bind_all('<Button-4>', self._on_lazy_scroll)  # Linux scroll up
-        self._lazy_settings_canvas.bind_all('<Button-5>', self._on_lazy_scroll)  # Linux scroll down
+        # Wheel events go to the widget under the pointer, so the app-wide wheel binding is
+        # only held while the pointer is over the settings canvas
+        self._lazy_settings_canvas.bind('<Enter>', self._on_lazy_canvas_enter)
+        self._lazy_settings_canvas.bind('<Leave>', self._on_lazy_canvas_leave)
+        if self._pointer_over_lazy_canvas(*self.root.winfo_pointerxy()):
+            self._on_lazy_canvas_enter()
         self._lazy_settings_last_y = 0
         self._lazy_settings_last_max = 0
         self._lazy_settings_loading = False
+        self._lazy_scroll_pending = False
         self._lazy_settings_load_batch(0)
 
     def _on_lazy_scroll(self, event=None):
+        # A fast wheel spin or resize sends a burst of events; check the position once at idle
+        if not self._lazy_scroll_pending:
+            self._lazy_scroll_pending = True
+            self.root.after_idle(self._process_lazy_scroll)
+
+    def _process_lazy_scroll(self):
         # Check if near bottom, then load more
+        self._lazy_scroll_pending = False
         canvas = self._lazy_settings_canvas
         try:
             yview = canvas.yview()
             if yview[1] > 0.95 and not self._lazy_settings_loading:
-                # Near bottom, load next batch
+                # Near bottom, load next batch. The scroll position only reflects the new
+                # widgets after the next layout pass, so ignore further ticks until idle
                 self._lazy_settings_loading = True
-                self._lazy_settings_load_batch(len(self._lazy_loaded_indices))
-                self._lazy_settings_loading = False
+                self._lazy_settings_load_batch(self._lazy_loaded_order[-1] + 1 if self._lazy_loaded_order else 0)
+                self.root.after_idle(self._end_lazy_settings_loading)
         except Exception:
-            pass
+            self._lazy_settings_loading = False
+
+    def _end_lazy_settings_loading(self):
+        self._lazy_settings_loading = False
+
+    def _on_lazy_canvas_enter(self, event=None):
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):  # Button-4/5: Linux scroll up/down
+            self._lazy_settings_canvas.bind_all(sequence, self._on_lazy_scroll)
+
+    def _pointer_over_lazy_canvas(self, x_root, y_root):
+        inside = self.root.winfo_containing(x_root, y_root)
+        if inside is None:
+            return False
+        # The canvas itself or a descendant; a bare prefix test would also match siblings like .!canvas2
+        canvas_path = str(self._lazy_settings_canvas)
+        inside_path = str(inside)
+        return inside_path == canvas_path or inside_path.startswith(canvas_path + '.')
+
+    def _on_lazy_canvas_leave(self, event):
+        # Moving onto a setting widget inside the canvas also raises <Leave>; keep the binding then
+        if self._pointer_over_lazy_canvas(event.x_root, event.y_root):
+            return
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self._lazy_settings_canvas.unbind_all(sequence)
 
     def _lazy_settings_load_batch(self, start_index):
         end_index = min(start_index + self._lazy_batch_size, self._lazy_settings_total)
@@ -1294,15 +1840,18 @@ class EnhancedBIOSSettingsGUI:
             if i not in self._lazy_loaded_indices:
                 self.create_setting_widget(self.settings[i], i)
                 self._lazy_loaded_indices.add(i)
+                self._lazy_loaded_order.append(i)
         # Remove widgets far above current scroll for memory
-        if len(self._lazy_loaded_indices) > self._lazy_keep_widgets:
-            min_index = min(self._lazy_loaded_indices)
-            max_index = max(self._lazy_loaded_indices)
-            to_remove = [idx for idx in self._lazy_loaded_indices if idx < max_index - self._lazy_keep_widgets]
-            for idx in to_remove:
-                widget = self.setting_widgets.get(self.settings[idx].token)
-                if widget:
-                    widget.master.destroy()
+        order = self._lazy_loaded_order
+        if len(order) > self._lazy_keep_widgets:
+            oldest_kept = order[-1] - self._lazy_keep_widgets
+            while order[0] < oldest_kept:
+                idx = order.popleft()
+                # Hide the card and keep it for the next batch rather than destroying it
+                card = self._cards_in_use.pop(idx, None)
+                if card is not None:
+                    card.frame.pack_forget()
+                    self._card_pool.append(card)
                 self._lazy_loaded_indices.remove(idx)
                 self.setting_widgets.pop(self.settings[idx].token, None)
 
@@ -1313,30 +1862,32 @@ class EnhancedBIOSSettingsGUI:
         for widget in self.category_menu_frame.winfo_children():
             widget.destroy()
 
-        from collections import Counter
-        stopwords = set([
-            'the', 'and', 'or', 'to', 'of', 'in', 'for', 'on', 'with', 'by', 'is', 'at', 'as', 'an', 'be', 'are',
-            'from', 'this', 'that', 'it', 'if', 'not', 'can', 'will', 'a', 'but', 'was', 'has', 'have', 'may', 'all',
-            'help', 'string', 'text', 'value', 'option', 'set', 'setting', 'settings', 'default', 'enable', 'disable',
-            'yes', 'no', 'auto', 'user', 'system', 'mode', 'type', 'select', 'use', 'change', 'current', 'bios', 'token',
-            'offset', 'width', 'page', 'number', 'data', 'field', 'bit', 'bits', 'description', 'desc', 'info', 'information',
-            'boot', 'save', 'import', 'export', 'file', 'load', 'backup', 'restore', 'undo', 'redo', 'option', 'options',
-            'nvram', 'msi', 'ami', 'center', 'utility', 'ver', 'copyright', 'reserved', 'crc32', 'script', 'name', 'created',
-            'do', 'not', 'change', 'line', 'move', 'desired', 'move', 'move', 'move', 'move', 'move', 'move', 'move', 'move',
-        ])
-        word_counter = Counter()
-        for s in self.settings:
-            for text in (str(s.setup_question), str(s.help_string), str(s.token)):
-                words = re.findall(r'\b\w+\b', text.lower())
-                for w in words:
-                    if w not in stopwords and len(w) > 2:
-                        word_counter[w] += 1
-        sorted_words = [w for w, _ in word_counter.most_common()]
+        # Word ranking only changes when a new settings list is loaded
+        cached_settings, sorted_words, word_index = self._category_words_cache
+        if cached_settings is not self.settings:
+            from collections import Counter
+            # One lowercase + tokenize pass over every field of every setting; Counter counts in C
+            text = "\n".join(f"{s.setup_question}\n{s.help_string}\n{s.token}" for s in self.settings).lower()
+            word_counter = Counter(w for w in _RE_WORD.findall(text)
+                                   if len(w) > 2 and w not in _CATEGORY_STOPWORDS)
+            sorted_words = [w for w, _ in word_counter.most_common()]
+            # Substring index for the typed filter: every word in one newline-joined string,
+            # with each word's start offset so a match position maps back to its word
+            starts = []
+            offset = 0
+            for w in sorted_words:
+                starts.append(offset)
+                offset += len(w) + 1
+            word_index = {'blob': "\n".join(sorted_words), 'starts': starts,
+                          'display': [w.capitalize() for w in sorted_words]}
+            # Keyed on the list object itself: an id() could be reused by the next load's list
+            self._category_words_cache = (self.settings, sorted_words, word_index)
         self._category_menu_state['words'] = sorted_words
+        self._category_menu_state.update(word_index)
 
         # Create a combobox for categories
         self.category_var = tk.StringVar()
-        category_combo = ttk.Combobox(self.category_menu_frame, textvariable=self.category_var, values=[w.capitalize() for w in sorted_words], font=("Arial", 10))
+        category_combo = ttk.Combobox(self.category_menu_frame, textvariable=self.category_var, values=word_index['display'], font=("Arial", 10))
         category_combo.pack(fill=tk.X, padx=2, pady=2)
         category_combo.set("")
         category_combo.bind("<KeyRelease>", self._on_category_combo_typed)
@@ -1350,8 +1901,20 @@ class EnhancedBIOSSettingsGUI:
     def _on_category_combo_typed(self, event=None):
         # As user types, filter the dropdown list
         val = self.category_var.get().strip().lower()
-        all_words = self._category_menu_state.get('words', [])
-        filtered = [w.capitalize() for w in all_words if val in w]
+        state = self._category_menu_state
+        display = state.get('display', [])
+        if not val:
+            filtered = display
+        else:
+            # str.find scans the joined words in C; only matches are mapped back with bisect
+            blob, starts = state['blob'], state['starts']
+            filtered = []
+            pos = blob.find(val)
+            while pos != -1:
+                i = bisect.bisect_right(starts, pos) - 1
+                filtered.append(display[i])
+                # Resume at the next word: one hit per word is enough
+                pos = blob.find(val, starts[i + 1]) if i + 1 < len(starts) else -1
         if event is not None and getattr(event, 'widget', None) is not None:
             event.widget['values'] = filtered
     
@@ -1363,28 +1926,28 @@ class EnhancedBIOSSettingsGUI:
             except ValueError:
                 messagebox.showerror("Validation Error", f"Value for {setting.setup_question} must be numeric.")
                 return False
-        if setting.options and value not in setting.options:
+        if setting.options and not setting.is_option_value(value):
             messagebox.showerror("Validation Error", f"Value '{value}' not in allowed options for {setting.setup_question}.")
             return False
         return True
     
     # Utility methods
     def find_scetool_path(self):
-        """Locate MSI SCEWIN tools directory"""
+        """Locate MSI SCEWIN tools directory, reusing the last result while the file still exists"""
+        if self._scetool_path and os.path.isfile(self._scetool_path):
+            return self._scetool_path
+        self._scetool_path = self._find_scetool_path_uncached()
+        return self._scetool_path
+    
+    def _find_scetool_path_uncached(self):
         # Try PATH first
         scetool = shutil.which("SCEWIN.exe")
         if scetool:
             return scetool
-        # Try common MSI Center install location
-        possible_dirs = [
-            r"C:\Program Files (x86)\MSI\MSI Center\Lib\SCEWIN\5.05.01.0002",
-            r"C:\Program Files\MSI\MSI Center\Lib\SCEWIN\5.05.01.0002"
-        ]
-        for d in possible_dirs:
-            exe_path = os.path.join(d, "SCEWIN.exe")
-            if os.path.isfile(exe_path):
-                return exe_path
-        return None
+        # Try MSI Center install locations, preferring the most recently installed version
+        import glob
+        matches = glob.glob(_SCETOOL_GLOB)
+        return max(matches, key=os.path.getmtime) if matches else None
     
     def run_scetool_with_progress(self, scetool_path, command, progress):
         """Run SCEWIN tool with progress tracking"""
@@ -1430,25 +1993,39 @@ class EnhancedBIOSSettingsGUI:
             ]
         )
         if file_path:
+            # Tk calls stay on the main thread: the worker only schedules them with root.after
+            progress = ProgressDialog(self.root, "Saving File", 
+                                    "Generating NVRAM file...")
+            progress_callback = self._threadsafe_progress(progress)
             def save_worker():
-                progress = ProgressDialog(self.root, "Saving File", 
-                                        "Generating NVRAM file...")
-                def progress_callback(value, status=""):
-                    progress.update_progress(value, status)
                 try:
                     self.generate_nvram_file(file_path, progress_callback)
-                    progress.close()
+                    self.root.after(0, progress.close)
                 except Exception as e:
-                    progress.close()
-                    messagebox.showerror("File Generation Error", f"Failed to generate NVRAM file: {str(e)}")
+                    self.root.after(0, progress.close)
+                    self.root.after(0, messagebox.showerror, "File Generation Error", f"Failed to generate NVRAM file: {str(e)}")
             thread = threading.Thread(target=save_worker)
             thread.daemon = True
             thread.start()
 
+    def _threadsafe_progress(self, progress, start=0, span=100):
+        """Progress callback for worker threads: maps 0-100 onto start..start+span and posts the
+        update to the Tk thread with root.after, at most once every 50 ms"""
+        last_update = [0.0]
+        def progress_callback(value, status=""):
+            # The final 100% (or failure) update always goes through
+            now = time.monotonic()
+            if now - last_update[0] >= 0.05 or value in (0, 100):
+                last_update[0] = now
+                self.root.after(0, progress.update_progress, start + value * span / 100, status)
+        return progress_callback
+
     def generate_nvram_file(self, file_path, progress_callback=None):
-        """Generate NVRAM file from current settings, preserving original block and only updating * or value as needed."""
+        """Generate NVRAM file from current settings, preserving original block and only updating * or value as needed.
+        Errors are reported through progress_callback and re-raised, so callers on worker threads can
+        show them on the Tk thread."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as file:
                 # Write header
                 if progress_callback:
                     progress_callback(10, "Writing header...")
@@ -1461,57 +2038,62 @@ class EnhancedBIOSSettingsGUI:
                     file.write("// AMISCE Utility. Ver 5.05.01.0002\n")
                     file.write("// Copyright (c) 2021 AMI. All rights reserved.\n")
                     file.write(f"HIICrc32= {self.parser.header_info.get('crc32', '67B9B44E')}\n\n")
-                # Write settings
+                # Write settings; the hot loop works on local names rather than repeated attribute lookups
                 total_settings = len(self.settings)
+                write = file.write
+                mark_option = _RE_OPTION_MARK.sub
+                replace_value = _RE_ANGLE_VALUE.sub
                 for i, setting in enumerate(self.settings):
                     if progress_callback and i % 50 == 0:
                         progress_callback(int(10 + 90 * i / total_settings), f"Writing setting {i+1}/{total_settings}")
                     # Copy original block and only update * or value as needed
-                    block_lines = list(setting.original_block_lines)
+                    block_lines = setting.original_block_lines
+                    has_options = setting.original_has_options
+                    options = setting.options
+                    current_value = setting.current_value
                     # Update * marker for options
-                    if getattr(setting, 'original_has_options', False) and setting.options:
+                    if has_options and options:
                         # Remove all * markers
                         new_lines = []
                         for line in block_lines:
                             # Remove * from options lines
-                            if re.match(r'\s*\*?\[', line.strip()):
-                                new_lines.append(re.sub(r'\*', '', line, count=1))
-                            elif re.match(r'Options\s*=\s*\*?\[', line.strip()):
-                                new_lines.append(re.sub(r'\*', '', line, count=1))
+                            if _is_option_line(line.strip()):
+                                new_lines.append(line.replace('*', '', 1))
                             else:
                                 new_lines.append(line)
-                        # Add * to the correct option
-                        for idx, (value, desc, _) in enumerate(setting.options):
+                        # Add * to the correct option: only options holding the current value
+                        # need their line found, so the lines are scanned once, not once per option
+                        current = str(current_value)
+                        for value, desc, _ in options:
+                            if str(value) != current:
+                                continue
                             # Find the line for this option
                             val_str = f'[{value}]'
                             for j, l in enumerate(new_lines):
                                 if val_str in l:
-                                    # Add * if this is the current value
-                                    if str(value) == str(setting.current_value):
-                                        # Insert * at the right place
-                                        new_lines[j] = re.sub(r'(Options\s*=\s*)?(\s*)', r'\1\2*', new_lines[j], count=1)
+                                    # Insert * at the right place
+                                    new_lines[j] = mark_option(r'\1\2*', l, count=1)
                         block_lines = new_lines
                     # Update value for value lines
-                    elif not getattr(setting, 'original_has_options', False):
+                    elif not has_options:
+                        new_value = f'<{current_value}>'
                         new_lines = []
                         for line in block_lines:
                             if line.strip().startswith('Value'):
-                                new_lines.append(re.sub(r'<[^>]*>', f'<{setting.current_value}>', line))
+                                new_lines.append(replace_value(new_value, line))
                             else:
                                 new_lines.append(line)
                         block_lines = new_lines
-                    # Write the block
-                    for line in block_lines:
-                        file.write(line.rstrip() + '\n')
+                    # Write the block with one call
+                    if block_lines:
+                        write('\n'.join([line.rstrip() for line in block_lines]) + '\n')
                 if progress_callback:
                     progress_callback(100, "Done writing NVRAM file.")
                 return True
         except Exception as e:
             if progress_callback:
                 progress_callback(0, f"Failed to generate NVRAM file: {str(e)}")
-            messagebox.showerror("File Generation Error", 
-                               f"Failed to generate NVRAM file: {str(e)}")
-            return False
+            raise
 
     def _display_settings_batch(self, matched_settings, start, batch_size=5):
         end = min(start + batch_size, len(matched_settings), 20)
@@ -1523,32 +2105,24 @@ class EnhancedBIOSSettingsGUI:
             self.root.after(10, lambda: self._display_settings_batch(matched_settings, end, batch_size))
         elif len(matched_settings) > 20:
             # Add Load More button after first 20
-            load_more_btn = ttk.Button(
-                self.scrollable_frame,
-                text=f"Load {len(matched_settings) - 20} more matches...",
-                command=lambda: self.load_more_search_results(matched_settings[20:])
+            self._add_load_more_button(
+                f"Load {len(matched_settings) - 20} more matches...",
+                lambda: self.load_more_search_results(matched_settings[20:])
             )
-            load_more_btn.pack(pady=10)
 
     def _get_settings_batch(self, batch_key, settings_list, cache=True):
         """Return a batch of settings, using LRU cache for large sets."""
-        import time
         if not cache:
             return settings_list
-        # LRU cache logic
-        now = time.time()
-        self._batch_access_times[batch_key] = now
-        # Purge old batches if over limit
-        if len(self._settings_batch_cache) > self._max_batches_in_memory:
-            # Remove least recently used
-            sorted_batches = sorted(self._batch_access_times.items(), key=lambda x: x[1])
-            for k, _ in sorted_batches[:-self._max_batches_in_memory]:
-                self._settings_batch_cache.pop(k, None)
-                self._batch_access_times.pop(k, None)
-        # Return from cache or store
-        if batch_key in self._settings_batch_cache:
-            return self._settings_batch_cache[batch_key]
+        # Return from cache, marking the batch most recently used
+        cached = self._settings_batch_cache.get(batch_key)
+        if cached is not None:
+            self._settings_batch_cache.move_to_end(batch_key)
+            return cached
+        # Store, then purge the least recently used batch if over limit
         self._settings_batch_cache[batch_key] = settings_list
+        if len(self._settings_batch_cache) > self._max_batches_in_memory:
+            self._settings_batch_cache.popitem(last=False)
         return settings_list
     
     def on_category_changed(self, event=None):
@@ -1565,24 +2139,32 @@ class EnhancedBIOSSettingsGUI:
         start = page * page_size
         end = min(start + page_size, len(self.settings))
         # Clear current display
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_settings_view(pack=False)
         self.setting_widgets.clear()
         for i in range(start, end):
             self.create_setting_widget(self.settings[i], i)
+        self._show_settings_container()
         # Track current page
         self._current_page = page
     
+    def _add_load_more_button(self, text, command):
+        """Pack a "Load More" button at the end of the settings view, replacing any current one"""
+        self._remove_load_more_button()
+        self._load_more_btn = ttk.Button(self._settings_container, text=text, command=command)
+        self._load_more_btn.pack(pady=10)
+    
+    def _remove_load_more_button(self):
+        if self._load_more_btn is not None:
+            self._load_more_btn.destroy()
+            self._load_more_btn = None
+    
     def load_more_settings(self, category, start_index):
         """Load more settings for a category, clearing unused widgets. Uses batch cache."""
         if category in self.parser.categories:
             batch = self._get_settings_batch(category, [(i, self.settings[i]) for i in self.parser.categories[category]], cache=True)
 
             # Remove the "Load More" button
-            for widget in self.scrollable_frame.winfo_children():
-                if isinstance(widget, ttk.Button) and "Load" in widget.cget("text"):
-                    widget.destroy()
-                    break
+            self._remove_load_more_button()
 
             # Load next batch
             end_index = min(start_index + 20, len(batch))
@@ -1591,20 +2173,15 @@ class EnhancedBIOSSettingsGUI:
 
             # Add "Load More" button if there are still more settings
             if end_index < len(batch):
-                load_more_btn = ttk.Button(
-                    self.scrollable_frame,
-                    text=f"Load {len(batch) - end_index} more settings...",
-                    command=lambda: self.load_more_settings(category, end_index)
+                self._add_load_more_button(
+                    f"Load {len(batch) - end_index} more settings...",
+                    lambda: self.load_more_settings(category, end_index)
                 )
-                load_more_btn.pack(pady=10)
     
     def load_more_search_results(self, remaining_settings, show_goto=False):
         """Load more search results, clearing unused widgets. Supports Go to button."""
         # Remove the "Load More" button
-        for widget in self.scrollable_frame.winfo_children():
-            if isinstance(widget, ttk.Button) and "Load" in widget.cget("text"):
-                widget.destroy()
-                break
+        self._remove_load_more_button()
 
         # Load next batch of settings
         for i, (index, setting) in enumerate(remaining_settings[:20]):
@@ -1612,160 +2189,48 @@ class EnhancedBIOSSettingsGUI:
 
         # Add "Load More" button if there are more settings
         if len(remaining_settings) > 20:
-            load_more_btn = ttk.Button(
-                self.scrollable_frame,
-                text=f"Load {len(remaining_settings) - 20} more matches...",
-                command=lambda: self.load_more_search_results(remaining_settings[20:], show_goto=show_goto)
+            self._add_load_more_button(
+                f"Load {len(remaining_settings) - 20} more matches...",
+                lambda: self.load_more_search_results(remaining_settings[20:], show_goto=show_goto)
             )
-            load_more_btn.pack(pady=10)
     
-    def create_setting_widget(self, setting, index, show_goto=False):
-        """Create optimized widget for individual setting (memory and UI optimized)"""
-        # Ignore/commented-out settings (leading //): do not allow configuration
-        if str(setting.setup_question).strip().startswith("//") or str(setting.token).strip().startswith("//"):
-            # Show as grayed-out, not editable
-            setting_frame = ttk.LabelFrame(
-                self.scrollable_frame, 
-                text="[IGNORED] " + setting.setup_question[:80] + ("..." if len(setting.setup_question) > 80 else ""), 
-                padding=8
-            )
-            setting_frame.pack(fill=tk.X, padx=5, pady=3)
-            help_text = setting.help_string[:200] + ("..." if len(setting.help_string) > 200 else "") if setting.help_string else ""
-            if help_text.strip():
-                help_label = ttk.Label(setting_frame, text=help_text, foreground="gray", font=("Arial", 8))
-                help_label.pack(anchor=tk.W, pady=(0, 5))
-            tech_info = f"Token: {setting.token} | Offset: {setting.offset} | Default: {setting.bios_default}"
-            ttk.Label(setting_frame, text=tech_info, font=("Consolas", 7), foreground="gray").pack(anchor=tk.W, pady=(0, 5))
-            ttk.Label(setting_frame, text="This setting is ignored (commented out in BIOS file)", font=("Arial", 9, "italic"), foreground="gray").pack(anchor=tk.W, pady=(0, 5))
-            return
+    def apply_setting_value(self, s, val):
+        """Set a setting's value from its widget, recording it for undo and change review"""
+        old_value = s.current_value
+        self._set_current_value(s, val)
+        self.push_undo(s, old_value)
+        # Track the most recently changed token for highlight
+        self._last_changed_token = s.token
+
+    def _set_current_value(self, s, val):
+        """Set a setting's value, keeping the change-review state (original_value/dirty) up to date"""
+        if not s.dirty:
+            s.original_value = s.current_value
+            s.dirty = True
+        s.current_value = val
+        # Ensure only one option is marked as current
+        if s.options:
+            new_options = []
+            for value, desc, is_current in s.options:
+                new_is_current = (str(value) == str(val))
+                new_options.append((value, desc, new_is_current))
+            s.options = new_options
 
-        # Use a lightweight frame for each setting
-        setting_frame = ttk.LabelFrame(
-            self.scrollable_frame, 
-            text=setting.setup_question[:80] + ("..." if len(setting.setup_question) > 80 else ""), 
-            padding=8
-        )
-        setting_frame.pack(fill=tk.X, padx=5, pady=3)
-
-        # Only show help if not empty and not too long
-        if setting.help_string:
-            help_text = setting.help_string[:200] + ("..." if len(setting.help_string) > 200 else "")
-            if help_text.strip():
-                help_label = ttk.Label(setting_frame, text=help_text, 
-                                      foreground="gray", font=("Arial", 8))
-                help_label.pack(anchor=tk.W, pady=(0, 5))
-
-        # Technical info in compact format
-        tech_info = f"Token: {setting.token} | Offset: {setting.offset} | Default: {setting.bios_default}"
-        ttk.Label(setting_frame, text=tech_info, font=("Consolas", 7), foreground="darkblue").pack(anchor=tk.W, pady=(0, 5))
-
-        # Value input section
-        value_frame = ttk.Frame(setting_frame)
-        value_frame.pack(fill=tk.X, pady=(5, 0))
-
-        # Add Go to button if requested
-        if show_goto:
-            ttk.Button(value_frame, text="Go to", command=lambda idx=index: self.goto_setting_in_main(idx)).pack(side=tk.RIGHT, padx=(8, 0))
-
-        # Use a local function to minimize closure memory
-        def push_and_refresh(s, val):
-            self.push_undo()
-            s.current_value = val
-            # Ensure only one option is marked as current
-            if s.options:
-                new_options = []
-                for value, desc, is_current in s.options:
-                    new_is_current = (str(value) == str(val))
-                    new_options.append((value, desc, new_is_current))
-                s.options = new_options
-            # Track the most recently changed token for highlight
-            self._last_changed_token = s.token
-
-        # --- Dropdown logic for numeric fields with options ---
-        # If the setting has options (even if is_numeric), always use a dropdown if there are 2-10 options
-        use_dropdown = False
-        if setting.options and 2 <= len(setting.options) <= 10:
-            use_dropdown = True
-        # If the setting is numeric but has a small set of valid values, use dropdown
-        if setting.is_numeric and setting.options and 2 <= len(setting.options) <= 10:
-            use_dropdown = True
-
-        if use_dropdown:
-            # Use a dropdown (Combobox) for small option sets
-            values = [f"{value} : {desc[:50]}" + ("..." if len(desc) > 50 else "") if desc else str(value) for value, desc, _ in setting.options]
-            combo = ttk.Combobox(value_frame, values=values, state="readonly", width=60)
-            # Set current value
-            current_value = str(setting.current_value)
-            found = False
-            for i, (value, desc, _) in enumerate(setting.options):
-                if str(value) == current_value:
-                    combo.current(i)
-                    found = True
-                    break
-            if not found:
-                # fallback: set to current_value as string
-                combo.set(current_value)
-            combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            self.setting_widgets[setting.token] = combo
-
-            def on_combo_change(event=None, s=setting, c=combo):
-                sel = c.get()
-                # Extract value from "value : desc"
-                if ' : ' in sel:
-                    val = sel.split(' : ')[0].strip()
-                elif ' - ' in sel:
-                    val = sel.split(' - ')[0].strip()
-                else:
-                    val = sel.strip()
-                push_and_refresh(s, val)
-            combo.bind("<<ComboboxSelected>>", on_combo_change)
-        elif setting.is_numeric:
-            # Only use free-entry numeric field if no options or too many options
-            entry = ttk.Entry(value_frame, width=30)
-            entry.insert(0, str(setting.current_value))
-            entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            self.setting_widgets[setting.token] = entry
-            ttk.Label(value_frame, text="(Numeric)", font=("Arial", 8), foreground="blue").pack(side=tk.LEFT, padx=(5, 0))
-            def on_entry_change(event=None, s=setting, e=entry):
-                push_and_refresh(s, e.get())
-            entry.bind('<FocusOut>', on_entry_change)
-            entry.bind('<Return>', on_entry_change)
-        elif setting.options:
-            # Non-numeric, but has options: use dropdown
-            values = [f"{value} : {desc[:50]}" + ("..." if len(desc) > 50 else "") if desc else str(value) for value, desc, _ in setting.options]
-            combo = ttk.Combobox(value_frame, values=values, state="readonly", width=60)
-            current_value = str(setting.current_value)
-            found = False
-            for i, (value, desc, _) in enumerate(setting.options):
-                if str(value) == current_value:
-                    combo.current(i)
-                    found = True
-                    break
-            if not found:
-                combo.set(current_value)
-            combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            self.setting_widgets[setting.token] = combo
-
-            def on_combo_change(event=None, s=setting, c=combo):
-                sel = c.get()
-                if ' : ' in sel:
-                    val = sel.split(' : ')[0].strip()
-                elif ' - ' in sel:
-                    val = sel.split(' - ')[0].strip()
-                else:
-                    val = sel.strip()
-                push_and_refresh(s, val)
-            combo.bind("<<ComboboxSelected>>", on_combo_change)
-        else:
-            # Fallback: free-entry field
-            entry = ttk.Entry(value_frame, width=30)
-            entry.insert(0, str(setting.current_value))
-            entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            self.setting_widgets[setting.token] = entry
-            def on_entry_change(event=None, s=setting, e=entry):
-                push_and_refresh(s, e.get())
-            entry.bind('<FocusOut>', on_entry_change)
-            entry.bind('<Return>', on_entry_change)
+    def create_setting_widget(self, setting, index, show_goto=False):
+        """Show a setting in the settings view, reusing a pooled card's widgets when one is free"""
+        previous = self._cards_in_use.pop(index, None)
+        if previous is not None:
+            previous.frame.pack_forget()
+            self._card_pool.append(previous)
+        card = self._card_pool.pop() if self._card_pool else SettingCard(self, self.scrollable_frame)
+        widget = card.bind_setting(setting, index, show_goto)
+        # Cards are children of scrollable_frame so they outlive _clear_settings_view; they are
+        # packed into the current container and raised above it, a later-created sibling
+        card.frame.pack(in_=self._settings_container, fill=tk.X, padx=5, pady=3)
+        card.frame.lift()
+        self._cards_in_use[index] = card
+        if widget is not None:
+            self.setting_widgets[setting.token] = widget
 
     def goto_setting_in_main(self, idx):
         """Scroll to and highlight the setting at the given index in the main view."""
@@ -1775,21 +2240,24 @@ class EnhancedBIOSSettingsGUI:
     def display_filtered_settings(self, settings_list):
         """Display filtered settings with lazy loading and Go to buttons"""
         # Clear current display
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_settings_view(pack=False)
         # Display first batch with Go to buttons
         for i, (index, setting) in enumerate(settings_list[:20]):
             self.create_setting_widget(setting, index, show_goto=True)
         # Add "Load More" button if needed
         if len(settings_list) > 20:
-            load_more_btn = ttk.Button(
-                self.scrollable_frame,
-                text=f"Load {len(settings_list) - 20} more settings...",
-                command=lambda: self.load_more_search_results(settings_list[20:], show_goto=True)
+            self._add_load_more_button(
+                f"Load {len(settings_list) - 20} more settings...",
+                lambda: self.load_more_search_results(settings_list[20:], show_goto=True)
             )
-            load_more_btn.pack(pady=10)
+        self._show_settings_container()
 
 if __name__ == "__main__":
+    # Parse workers are spawned processes that re-import this module: in a frozen build
+    # freeze_support() hands them off to the worker code, and the admin relaunch and GUI
+    # below only run in the main process
+    multiprocessing.freeze_support()
+    run_as_admin()
     root = tk.Tk()
     app = EnhancedBIOSSettingsGUI(root)
     root.mainloop()